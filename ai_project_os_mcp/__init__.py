@@ -4,10 +4,7 @@ AI Project OS MCP SDK
 工程级AI行为控制协议SDK，用于将AI自动编程约束进真实软件工程流程。
 """
 
-from ai_project_os_mcp.server import MCPServer
-from ai_project_os_mcp import tools
-from ai_project_os_mcp import core
-from ai_project_os_mcp import adapters
+import importlib
 
 __version__ = "2.5.0"
 __author__ = "AI Project OS"
@@ -19,3 +16,29 @@ __all__ = [
     "core",
     "adapters",
 ]
+
+# 按需导入的公开名称: 名称 -> (模块, 属性)，属性为 None 表示子模块本身
+_LAZY_EXPORTS = {
+    "MCPServer": ("ai_project_os_mcp.server", "MCPServer"),
+    "tools": ("ai_project_os_mcp.tools", None),
+    "core": ("ai_project_os_mcp.core", None),
+    "adapters": ("ai_project_os_mcp.adapters", None),
+}
+
+
+def __getattr__(name):
+    """
+    首次访问时导入公开名称 (PEP 562)
+    """
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module_name, attr = _LAZY_EXPORTS[name]
+    module = importlib.import_module(module_name)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,12 +2,33 @@
 适配器模块 - 适配不同AI Agent
 """
 
-from ai_project_os_mcp.adapters.claude import ClaudeAdapter
-from ai_project_os_mcp.adapters.cursor import CursorAdapter
-from ai_project_os_mcp.adapters.trae import TraeAdapter
+import importlib
 
 __all__ = [
     "ClaudeAdapter",
     "CursorAdapter",
     "TraeAdapter"
 ]
+
+# 按需导入的适配器: 名称 -> 模块
+_LAZY_EXPORTS = {
+    "ClaudeAdapter": "ai_project_os_mcp.adapters.claude",
+    "CursorAdapter": "ai_project_os_mcp.adapters.cursor",
+    "TraeAdapter": "ai_project_os_mcp.adapters.trae",
+}
+
+
+def __getattr__(name):
+    """
+    首次访问时导入适配器 (PEP 562)
+    """
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,6 +5,19 @@ Claude适配器 - 适配Claude AI
 from ai_project_os_mcp.core.state_manager import StateManager
 from ai_project_os_mcp.tools import get_stage, freeze_stage, guard_src, submit_audit
 
+SYSTEM_PROMPT = """
+You are an AI Project OS MCP Agent.
+
+You MUST:
+- Call get_stage before any action
+- Refuse code unless stage == S5
+- Call guard_src before src changes
+- Require Context Refresh
+- Submit audit for every S5 task
+
+Violation = hard refusal.
+"""
+
 class ClaudeAdapter:
     """
     Claude AI适配器，用于将MCP规则应用到Claude
@@ -32,18 +45,7 @@ class ClaudeAdapter:
         Returns:
             str: System Prompt字符串
         """
-        return """
-You are an AI Project OS MCP Agent.
-
-You MUST:
-- Call get_stage before any action
-- Refuse code unless stage == S5
-- Call guard_src before src changes
-- Require Context Refresh
-- Submit audit for every S5 task
-
-Violation = hard refusal.
-"""
+        return SYSTEM_PROMPT
     
     def handle_tool_call(self, tool_name, payload):
         """
@@ -56,17 +58,18 @@ Violation = hard refusal.
         Returns:
             dict: 工具调用结果
         """
-        if tool_name not in self.tools:
+        tool = self.tools.get(tool_name)
+        if tool is None:
             return {"error": f"Unknown tool: {tool_name}"}
         
         # 加载当前状态
         state = self.state_manager.load_state()
         
         # 调用工具
-        result = self.tools[tool_name](state, payload)
+        result = tool(state, payload)
         
         # 如果是冻结阶段，更新状态
-        if tool_name == "freeze_stage" and result["success"]:
+        if tool is freeze_stage and result["success"]:
             self.state_manager.save_state(result["new_state"])
         
         return result
@@ -2,23 +2,44 @@
 Cursor适配器 - 适配Cursor AI
 """
 
+from types import MappingProxyType
+
 from ai_project_os_mcp.core.state_manager import StateManager
 from ai_project_os_mcp.core.rule_engine import RuleEngine
 
+# 默认受src guard保护的路径前缀
+DEFAULT_GUARDED_PREFIXES = ("src/",)
+
+# 编辑器配置（只读，导入时构建一次）
+EDITOR_CONFIG = MappingProxyType({
+    "onCodeGenerate": MappingProxyType({
+        "validate": True,
+        "requireContextRefresh": True,
+        "requirePseudoTDD": True
+    }),
+    "onFileWrite": MappingProxyType({
+        "validateSrcGuard": True,
+        "checkStage": True
+    })
+})
+
 class CursorAdapter:
     """
     Cursor AI适配器，用于将MCP规则应用到Cursor
     """
     
-    def __init__(self, project_root="."):
+    def __init__(self, project_root=".", guarded_prefixes=None):
         """
         初始化Cursor适配器
         
         Args:
             project_root: 项目根目录路径
+            guarded_prefixes: 受src guard保护的路径前缀（可选，默认 DEFAULT_GUARDED_PREFIXES）
         """
         self.state_manager = StateManager(project_root)
         self.rule_engine = RuleEngine()
+        # 转为元组，以便 str.startswith 一次匹配全部前缀
+        self._guarded_prefixes = tuple(guarded_prefixes or DEFAULT_GUARDED_PREFIXES)
     
     def can_write_code(self, file_path):
         """
@@ -32,8 +53,8 @@ class CursorAdapter:
         """
         state = self.state_manager.load_state()
         
-        # 检查是否是src目录下的文件
-        if file_path.startswith("src/"):
+        # 检查是否是受保护目录（默认src）下的文件
+        if file_path.startswith(self._guarded_prefixes):
             can_write, reason = self.rule_engine.can_modify_src(state)
             if not can_write:
                 return False, reason
@@ -71,16 +92,6 @@ class CursorAdapter:
         获取Cursor编辑器配置
         
         Returns:
-            dict: 编辑器配置
+            Mapping: 编辑器配置（只读）
         """
-        return {
-            "onCodeGenerate": {
-                "validate": True,
-                "requireContextRefresh": True,
-                "requirePseudoTDD": True
-            },
-            "onFileWrite": {
-                "validateSrcGuard": True,
-                "checkStage": True
-            }
-        }
+        return EDITOR_CONFIG
@@ -2,10 +2,75 @@
 Trae适配器 - 适配Trae多Agent环境
 """
 
+import sys
+from types import MappingProxyType
+
 from ai_project_os_mcp.core.state_manager import StateManager
 from ai_project_os_mcp.core.rule_engine import RuleEngine
 from ai_project_os_mcp.tools import get_stage, freeze_stage, guard_src, submit_audit
 
+# 多Agent配置（只读，导入时构建一次）
+AGENT_CONFIGS = MappingProxyType({
+    "agents": MappingProxyType({
+        "Planner": MappingProxyType({
+            "role": "S1-S4 Planning Agent",
+            "capabilities": ("get_stage", "freeze_stage"),
+            "constraints": ("No code generation", "Must freeze stage before proceeding")
+        }),
+        "Executor": MappingProxyType({
+            "role": "S5 Execution Agent",
+            "capabilities": ("get_stage", "guard_src", "submit_audit"),
+            "constraints": ("Code only in S5", "Must call guard_src before writing", "Must submit audit for each task")
+        }),
+        "Auditor": MappingProxyType({
+            "role": "Audit Validation Agent",
+            "capabilities": ("get_stage",),
+            "constraints": ("Read-only access", "Must validate all S5 tasks")
+        })
+    }),
+    "workflow": MappingProxyType({
+        "S1": "Planner",
+        "S2": "Planner",
+        "S3": "Planner",
+        "S4": "Planner",
+        "S5": "Executor -> Auditor"
+    })
+})
+
+# 通配符，匹配任意阶段或行为
+ANY = "*"
+
+ACTION_ALLOWED = (True, "Agent action allowed")
+
+
+def _intern(value):
+    """
+    驻留字符串，使规则表查找在键比较时命中同一对象
+    
+    Args:
+        value: 角色、阶段或行为名称
+        
+    Returns:
+        驻留后的字符串；非字符串原样返回
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _check_executor_write_src(state):
+    """
+    Executor写入src前必须已调用guard_src
+    
+    Args:
+        state: 当前项目状态
+        
+    Returns:
+        tuple: (is_valid, reason)
+    """
+    if not state.get("guard_called", False):
+        return False, "Executor must call guard_src before writing to src"
+    return ACTION_ALLOWED
+
+
 class TraeAdapter:
     """
     Trae多Agent适配器，用于将MCP规则应用到Trae多Agent环境
@@ -26,75 +91,73 @@ class TraeAdapter:
             "guard_src": guard_src,
             "submit_audit": submit_audit
         }
+        self._action_table = self._build_action_table()
+    
+    @staticmethod
+    def _build_action_table():
+        """
+        构建 (角色, 阶段, 行为) -> 校验结果 的规则表
+        
+        值为 (is_valid, reason) 元组，或接收 state 返回该元组的函数。
+        查找顺序见 validate_agent_action。
+        
+        Returns:
+            dict: 规则表
+        """
+        table = {
+            # Planner只能在S1-S4阶段活动，不能生成代码
+            ("Planner", "S5", ANY): (False, "Planner cannot operate in S5 stage"),
+            ("Planner", ANY, "generate_code"): (False, "Planner cannot generate code"),
+            # Executor只能在S5阶段活动，必须调用guard_src
+            ("Executor", ANY, ANY): (False, "Executor can only operate in S5 stage"),
+            ("Executor", "S5", ANY): ACTION_ALLOWED,
+            ("Executor", "S5", "write_src"): _check_executor_write_src,
+        }
+        # Auditor只能进行只读操作
+        for action_type in ("write_file", "generate_code", "modify_state"):
+            table[("Auditor", ANY, action_type)] = (False, "Auditor can only perform read-only operations")
+        return table
     
     def get_agent_configs(self):
         """
         获取Trae多Agent的配置
         
         Returns:
-            dict: 多Agent配置
+            Mapping: 多Agent配置（只读）
         """
-        return {
-            "agents": {
-                "Planner": {
-                    "role": "S1-S4 Planning Agent",
-                    "capabilities": ["get_stage", "freeze_stage"],
-                    "constraints": ["No code generation", "Must freeze stage before proceeding"]
-                },
-                "Executor": {
-                    "role": "S5 Execution Agent",
-                    "capabilities": ["get_stage", "guard_src", "submit_audit"],
-                    "constraints": ["Code only in S5", "Must call guard_src before writing", "Must submit audit for each task"]
-                },
-                "Auditor": {
-                    "role": "Audit Validation Agent",
-                    "capabilities": ["get_stage"],
-                    "constraints": ["Read-only access", "Must validate all S5 tasks"]
-                }
-            },
-            "workflow": {
-                "S1": "Planner",
-                "S2": "Planner",
-                "S3": "Planner",
-                "S4": "Planner",
-                "S5": "Executor -> Auditor"
-            }
-        }
+        return AGENT_CONFIGS
     
-    def validate_agent_action(self, agent_role, action_type):
+    def validate_agent_action(self, agent_role, action_type, state=None):
         """
         验证Agent的行为是否符合MCP规则
         
         Args:
             agent_role: Agent角色
             action_type: 行为类型
+            state: 已加载的项目状态（可选，未提供时自动加载）
             
         Returns:
             tuple: (is_valid, reason)
         """
-        state = self.state_manager.load_state()
-        current_stage = state["stage"]
-        
-        # Planner只能在S1-S4阶段活动，不能生成代码
-        if agent_role == "Planner":
-            if current_stage == "S5":
-                return False, "Planner cannot operate in S5 stage"
-            if action_type == "generate_code":
-                return False, "Planner cannot generate code"
+        if state is None:
+            state = self.state_manager.load_state()
+        agent_role = _intern(agent_role)
+        action_type = _intern(action_type)
+        current_stage = _intern(state["stage"])
         
-        # Executor只能在S5阶段活动，必须调用guard_src
-        elif agent_role == "Executor":
-            if current_stage != "S5":
-                return False, "Executor can only operate in S5 stage"
-            if action_type == "write_src" and not state.get("guard_called", False):
-                return False, "Executor must call guard_src before writing to src"
-        
-        # Auditor只能进行只读操作
-        elif agent_role == "Auditor":
-            if action_type in ["write_file", "generate_code", "modify_state"]:
-                return False, "Auditor can only perform read-only operations"
+        # 由具体到通配依次查表，首个命中的规则生效
+        table = self._action_table
+        for key in (
+            (agent_role, current_stage, action_type),
+            (agent_role, current_stage, ANY),
+            (agent_role, ANY, action_type),
+            (agent_role, ANY, ANY),
+        ):
+            rule = table.get(key)
+            if rule is not None:
+                return rule(state) if callable(rule) else rule
         
-        return True, "Agent action allowed"
+        return ACTION_ALLOWED
     
     def handle_tool_call(self, agent_role, tool_name, payload):
         """
@@ -108,22 +171,23 @@ class TraeAdapter:
         Returns:
             dict: 工具调用结果
         """
+        # 加载当前状态（验证与工具调用共用同一份）
+        state = self.state_manager.load_state()
+        
         # 验证Agent行为
-        is_valid, reason = self.validate_agent_action(agent_role, tool_name)
+        is_valid, reason = self.validate_agent_action(agent_role, tool_name, state)
         if not is_valid:
             return {"success": False, "error": reason}
         
-        if tool_name not in self.tools:
+        tool = self.tools.get(tool_name)
+        if tool is None:
             return {"success": False, "error": f"Unknown tool: {tool_name}"}
         
-        # 加载当前状态
-        state = self.state_manager.load_state()
-        
         # 调用工具
-        result = self.tools[tool_name](state, payload)
+        result = tool(state, payload)
         
         # 如果是冻结阶段，更新状态
-        if tool_name == "freeze_stage" and result["success"]:
+        if tool is freeze_stage and result["success"]:
             self.state_manager.save_state(result["new_state"])
         
         return result
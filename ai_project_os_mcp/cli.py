@@ -2,22 +2,133 @@
 CLI entry point for AI Project OS MCP Server.
 """
 
-import argparse
 import sys
 import os
-from ai_project_os_mcp.server import MCPServer
 from ai_project_os_mcp.config import config
 
-def main():
-    parser = argparse.ArgumentParser(description="AI Project OS MCP Server")
-    parser.add_argument("--start", action="store_true", help="Start the MCP server")
-    parser.add_argument("--transport", choices=["stdio", "http"], default="stdio", help="Transport mode (stdio or http)")
-    parser.add_argument("--port", type=int, default=8000, help="Port for HTTP server")
-    parser.add_argument("--root", default=".", help="Project root directory")
+USAGE = """usage: ai-os-mcp [-h] [--start] [--transport {stdio,http}] [--port PORT] [--root ROOT]
+
+AI Project OS MCP Server
+
+options:
+  -h, --help            show this help message and exit
+  --start               Start the MCP server
+  --transport {stdio,http}
+                        Transport mode (stdio or http)
+  --port PORT           Port for HTTP server
+  --root ROOT           Project root directory
+"""
+
+TRANSPORTS = ("stdio", "http")
+
+LONG_OPTIONS = ("--help", "--start", "--transport", "--port", "--root")
+
+
+class CLIArgs:
+    """
+    Parsed command line arguments
+    """
+    
+    def __init__(self):
+        self.start = False
+        self.transport = "stdio"
+        self.port = 8000
+        self.root = "."
+
+
+def _usage_error(message):
+    """
+    Print usage and an error message, then exit with status 2
+    
+    Args:
+        message: Error message
+    """
+    sys.stderr.write(USAGE.split("\n\n", 1)[0] + "\n")
+    sys.stderr.write(f"ai-os-mcp: error: {message}\n")
+    sys.exit(2)
+
+
+def _resolve_option(name):
+    """
+    Resolve a long option, allowing unique prefixes as argparse does
     
-    args = parser.parse_args()
+    Args:
+        name: Option as given, e.g. "--tra"
+    
+    Returns:
+        str or None: Full option name, or None if it matches no option
+    """
+    if name in LONG_OPTIONS:
+        return name
+    if not name.startswith("--") or len(name) < 3:
+        return None
+    matches = [option for option in LONG_OPTIONS if option.startswith(name)]
+    if len(matches) > 1:
+        _usage_error(f"ambiguous option: {name} could match {', '.join(matches)}")
+    return matches[0] if matches else None
+
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments
+    
+    A small sys.argv scanner is used instead of argparse to keep CLI start-up
+    cheap. Like argparse, it accepts both "--flag value" and "--flag=value"
+    forms and unique prefixes of long options (e.g. "--tra" for "--transport").
+    
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+    
+    Returns:
+        CLIArgs: Parsed arguments
+    """
+    args = CLIArgs()
+    remaining = list(sys.argv[1:] if argv is None else argv)
+    
+    while remaining:
+        arg = remaining.pop(0)
+        if arg == "-h":
+            arg = "--help"
+        name, sep, value = arg.partition("=")
+        option = _resolve_option(name)
+        if option is None:
+            _usage_error(f"unrecognized arguments: {arg}")
+        
+        if option in ("--help", "--start"):
+            if sep:
+                _usage_error(f"argument {option}: ignored explicit argument '{value}'")
+            if option == "--help":
+                sys.stdout.write(USAGE)
+                sys.exit(0)
+            args.start = True
+            continue
+        
+        if not sep:
+            if not remaining:
+                _usage_error(f"argument {option}: expected one argument")
+            value = remaining.pop(0)
+        
+        if option == "--transport":
+            if value not in TRANSPORTS:
+                _usage_error(f"argument --transport: invalid choice: '{value}' (choose from 'stdio', 'http')")
+            args.transport = value
+        elif option == "--port":
+            try:
+                args.port = int(value)
+            except ValueError:
+                _usage_error(f"argument --port: invalid int value: '{value}'")
+        else:
+            args.root = value
+    
+    return args
+
+def main():
+    args = parse_args()
     
     if args.start:
+        # Imported here so --help does not load the server stack
+        from ai_project_os_mcp.server import MCPServer
+        
         # Update config with CLI args
         config.project_root = args.root
         
@@ -31,7 +142,7 @@ def main():
         elif args.transport == "http":
             server.start_http(port=args.port)
     else:
-        parser.print_help()
+        sys.stdout.write(USAGE)
 
 if __name__ == "__main__":
     main()
@@ -2,8 +2,152 @@
 Configuration management for AI Project OS MCP Server.
 """
 
+import copy
 import os
 import yaml
+from collections import ChainMap
+from collections.abc import Mapping
+from types import MappingProxyType
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Parsed YAML documents keyed by (path, mtime, size)
+_YAML_CACHE = {}
+
+
+def _load_yaml_cached(path):
+    """
+    Load a YAML file, reusing the parsed result while the file is unchanged
+    
+    Args:
+        path: YAML file path
+        
+    Returns:
+        Parsed data (a private copy), or None if the file does not exist
+    """
+    # A single stat both checks existence and provides the cache key
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    
+    key = (os.path.abspath(path), st.st_mtime, st.st_size)
+    if key not in _YAML_CACHE:
+        with open(path, "r", encoding="utf-8") as f:
+            _YAML_CACHE[key] = yaml.load(f, Loader=_SafeLoader)
+    
+    # Callers merge the data into their own dicts, so never hand out the cached object
+    return copy.deepcopy(_YAML_CACHE[key])
+
+
+def _freeze(value):
+    """
+    Recursively convert dicts to read-only mappings and lists to tuples
+    
+    Args:
+        value: Plain data value
+        
+    Returns:
+        Immutable equivalent of the value
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value):
+    """
+    Recursively convert mappings to dicts and tuples to lists
+    
+    Args:
+        value: Data value, possibly containing frozen or layered parts
+        
+    Returns:
+        Plain (JSON-serializable) equivalent of the value
+    """
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(v) for v in value]
+    return value
+
+
+# Built-in defaults, built once at import and shared by every Config
+DEFAULT_RULES = MappingProxyType({
+    "R1": "AI MUST query current stage before any action",
+    "R2": "AI MUST NOT generate code unless stage == S5",
+    "R3": "AI MUST abort on architecture violation",
+    "R4": "AI MUST submit audit for every S5 task",
+    "R5": "AI MUST respect src guard and lock status"
+})
+
+# Read-only: Config layers overrides on top via ChainMap, never writes here
+DEFAULT_POLICIES = _freeze({
+    "dependency_governance": {
+        "enabled": True,
+        "max_violations": 0,
+        "allowed_sources": ["pypi", "conda-forge"]
+    },
+    "audit_policy": {
+        "required_fields": ["sub_task_id", "layer", "files_changed", "correctness_assertion", "architecture_compliance", "reviewer"],
+        "retention_days": 365,
+        "auto_approval": False
+    },
+    "architecture_compliance": {
+        "enabled": True,
+        "max_violations": 0,
+        "allowed_layer_dependencies": {
+            "core": [],
+            "tools": ["core"],
+            "adapters": ["core", "tools"],
+            "server": ["core", "tools", "adapters"]
+        }
+    },
+    "testing_policy": {
+        "coverage_requirement": 80,
+        "required": True,
+        "skip_allowed": ["documentation_only", "dependency_update"]
+    },
+    "security_policy": {
+        "code_scanning": True,
+        "sensitive_data_detection": True,
+        "dependency_vulnerability_check": True
+    },
+    "stage_management": {
+        "require_approval_for_advance": True,
+        "allowed_transitions": {
+            "S1": ["S2"],
+            "S2": ["S3"],
+            "S3": ["S4"],
+            "S4": ["S5"],
+            "S5": ["S1"]
+        }
+    }
+})
+
+# Copied per Config because the policy file may update it
+DEFAULT_PERMISSIONS = _freeze({
+    "allowed_modifications": [
+        "dependency_governance.max_violations",
+        "dependency_governance.allowed_sources",
+        "audit_policy.retention_days",
+        "testing_policy.coverage_requirement",
+        "testing_policy.skip_allowed"
+    ],
+    "prohibited_modifications": [
+        "version",
+        "policies.*.enabled",
+        "policies.architecture_compliance.allowed_layer_dependencies",
+        "policies.stage_management.allowed_transitions",
+        "permissions"
+    ]
+})
+
 
 class Config:
     """
@@ -20,13 +164,7 @@ class Config:
         # Load defaults
         self.name = "ai-project-os-mcp"
         self.version = "0.1"
-        self.rules = {
-            "R1": "AI MUST query current stage before any action",
-            "R2": "AI MUST NOT generate code unless stage == S5",
-            "R3": "AI MUST abort on architecture violation",
-            "R4": "AI MUST submit audit for every S5 task",
-            "R5": "AI MUST respect src guard and lock status"
-        }
+        self.rules = dict(DEFAULT_RULES)
         self.violation_policy = "hard_refusal"
         self.audit_required_stage = "S5"
         
@@ -34,66 +172,15 @@ class Config:
         self.dependency_whitelist = []
         self.dependency_blacklist = []
         
-        # Policy Configuration
-        self.policies = {
-            "dependency_governance": {
-                "enabled": True,
-                "max_violations": 0,
-                "allowed_sources": ["pypi", "conda-forge"]
-            },
-            "audit_policy": {
-                "required_fields": ["sub_task_id", "layer", "files_changed", "correctness_assertion", "architecture_compliance", "reviewer"],
-                "retention_days": 365,
-                "auto_approval": False
-            },
-            "architecture_compliance": {
-                "enabled": True,
-                "max_violations": 0,
-                "allowed_layer_dependencies": {
-                    "core": [],
-                    "tools": ["core"],
-                    "adapters": ["core", "tools"],
-                    "server": ["core", "tools", "adapters"]
-                }
-            },
-            "testing_policy": {
-                "coverage_requirement": 80,
-                "required": True,
-                "skip_allowed": ["documentation_only", "dependency_update"]
-            },
-            "security_policy": {
-                "code_scanning": True,
-                "sensitive_data_detection": True,
-                "dependency_vulnerability_check": True
-            },
-            "stage_management": {
-                "require_approval_for_advance": True,
-                "allowed_transitions": {
-                    "S1": ["S2"],
-                    "S2": ["S3"],
-                    "S3": ["S4"],
-                    "S4": ["S5"],
-                    "S5": ["S1"]
-                }
-            }
-        }
+        # Policy Configuration (built-in defaults; see _rebuild_policies)
+        self._default_policies = DEFAULT_POLICIES
         
-        self.permissions = {
-            "allowed_modifications": [
-                "dependency_governance.max_violations",
-                "dependency_governance.allowed_sources",
-                "audit_policy.retention_days",
-                "testing_policy.coverage_requirement",
-                "testing_policy.skip_allowed"
-            ],
-            "prohibited_modifications": [
-                "version",
-                "policies.*.enabled",
-                "policies.architecture_compliance.allowed_layer_dependencies",
-                "policies.stage_management.allowed_transitions",
-                "permissions"
-            ]
-        }
+        # Overrides from the policy file and the active environment
+        self._file_policies = {}
+        self._env_policies = {}
+        self._rebuild_policies()
+        
+        self.permissions = _thaw(DEFAULT_PERMISSIONS)
         
         # Load from files if exists
         self._load_from_file()
@@ -103,27 +190,23 @@ class Config:
         """
         Load policy configuration from YAML file
         """
-        if os.path.exists(self.policy_path):
-            try:
-                with open(self.policy_path, "r", encoding="utf-8") as f:
-                    policy_data = yaml.safe_load(f)
-                    if policy_data:
-                        self._update_policy_from_dict(policy_data)
-            except Exception as e:
-                print(f"Warning: Failed to load policy file: {e}")
+        try:
+            policy_data = _load_yaml_cached(self.policy_path)
+            if policy_data:
+                self._update_policy_from_dict(policy_data)
+        except Exception as e:
+            print(f"Warning: Failed to load policy file: {e}")
     
     def _load_from_file(self):
         """
         Load configuration from YAML file
         """
-        if os.path.exists(self.config_path):
-            try:
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    config_data = yaml.safe_load(f)
-                    if config_data:
-                        self._update_from_dict(config_data)
-            except Exception as e:
-                print(f"Warning: Failed to load config file: {e}")
+        try:
+            config_data = _load_yaml_cached(self.config_path)
+            if config_data:
+                self._update_from_dict(config_data)
+        except Exception as e:
+            print(f"Warning: Failed to load config file: {e}")
     
     def _update_from_dict(self, data):
         """
@@ -161,25 +244,41 @@ class Config:
         # Update policies
         if "policies" in policy_data:
             for policy_name, policy_config in policy_data["policies"].items():
-                if policy_name in self.policies:
-                    # Update existing policy
-                    self.policies[policy_name].update(policy_config)
-                else:
-                    # Add new policy
-                    self.policies[policy_name] = policy_config
+                self._file_policies.setdefault(policy_name, {}).update(policy_config)
         
         # Update permissions
         if "permissions" in policy_data:
             self.permissions.update(policy_data["permissions"])
         
-        # Apply environment-specific configurations
+        # Apply environment-specific configurations (existing policies only)
         if "environments" in policy_data:
             env_config = policy_data["environments"].get(self.environment, {})
             if "policies" in env_config:
                 for policy_name, policy_config in env_config["policies"].items():
-                    if policy_name in self.policies:
-                        # Update existing policy with environment-specific config
-                        self.policies[policy_name].update(policy_config)
+                    if policy_name in self._default_policies or policy_name in self._file_policies:
+                        self._env_policies.setdefault(policy_name, {}).update(policy_config)
+        
+        self._rebuild_policies()
+    
+    def _rebuild_policies(self):
+        """
+        Rebuild the merged policies
+        
+        Each policy resolves keys from the environment overrides, then the
+        policy file, then the built-in defaults. The result is materialized
+        as plain dicts and lists, so the frozen defaults are never modified
+        and policies serialize like any other config value.
+        """
+        names = list(self._default_policies)
+        names.extend(name for name in self._file_policies if name not in self._default_policies)
+        self.policies = {
+            name: _thaw(ChainMap(
+                self._env_policies.get(name, {}),
+                self._file_policies.get(name, {}),
+                self._default_policies.get(name, {})
+            ))
+            for name in names
+        }
     
     def get_policy(self, policy_name, default=None):
         """
@@ -212,9 +311,43 @@ class Config:
         Get permissions configuration
         
         Returns:
-            dict: Permissions configuration
+            dict: Permissions configuration (shallow copy)
         """
         return self.permissions.copy()
+    
+    def get_permissions_copy(self):
+        """
+        Get a mutable copy of the permissions configuration
+        
+        Returns:
+            dict: Permissions configuration
+        """
+        return copy.deepcopy(self.permissions)
+
+class _LazyConfig:
+    """
+    Proxy for the global Config that defers file loading to first use
+    """
+    
+    def __init__(self):
+        self.__dict__["_instance"] = None
+    
+    def _get_instance(self):
+        """
+        Get the wrapped Config, constructing it on first access
+        
+        Returns:
+            Config: Global configuration
+        """
+        if self._instance is None:
+            self.__dict__["_instance"] = Config()
+        return self._instance
+    
+    def __getattr__(self, name):
+        return getattr(self._get_instance(), name)
+    
+    def __setattr__(self, name, value):
+        setattr(self._get_instance(), name, value)
 
-# Global config instance
-config = Config()
+# Global config instance (loaded on first attribute access)
+config = _LazyConfig()
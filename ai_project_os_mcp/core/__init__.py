@@ -2,8 +2,31 @@
 核心模块 - 5S + S5 稳定性规则
 """
 
-from ai_project_os_mcp.core.governance_engine import GovernanceEngine
+import importlib
 
 __all__ = [
     "GovernanceEngine"
 ]
+
+# 按需导入的公开名称: 名称 -> 模块
+# GovernanceEngine 会加载事件/策略/评分等全部引擎，仅需 StateManager 或
+# RuleEngine 的子模块导入不应承担这部分开销
+_LAZY_EXPORTS = {
+    "GovernanceEngine": "ai_project_os_mcp.core.governance_engine",
+}
+
+
+def __getattr__(name):
+    """
+    首次访问时导入公开名称 (PEP 562)
+    """
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
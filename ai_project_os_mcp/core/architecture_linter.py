@@ -9,9 +9,124 @@ Architecture Linter - 基于 AST 的架构合规检查引擎
 """
 
 import ast
+import hashlib
 import os
 import yaml
-from typing import Dict, List, Set, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# 被检查的包名，只有导入该包的语句参与层依赖检查
+PACKAGE_NAME = "ai_project_os_mcp"
+
+_PACKAGE_NAME_BYTES = PACKAGE_NAME.encode("ascii")
+
+# 判断导入是否属于本包时按长度切片比较，比 str.startswith 调用更快
+_PACKAGE_NAME_LENGTH = len(PACKAGE_NAME)
+
+# 直接调用 compile 生成 AST，省去 ast.parse 的包装开销（结果与报错信息相同）
+_AST_ONLY_FLAGS = ast.PyCF_ONLY_AST
+
+_IMPORT_TYPE = ast.Import
+_IMPORT_FROM_TYPE = ast.ImportFrom
+
+# 可能包含子语句的字段，按其在各节点 _fields 中的相对顺序排列
+_BLOCK_FIELDS = ("body", "handlers", "orelse", "finalbody", "cases")
+
+# 遍历时跳过的目录（不可能是源码包）：字节码缓存目录；以 "." 开头的目录
+# 以及含 pyvenv.cfg 的虚拟环境目录同样跳过。build、dist 等名称可能是真实的
+# 子包，不能按名称跳过
+SKIP_DIRS = frozenset({"__pycache__"})
+
+# 虚拟环境根目录中的标记文件
+_VENV_MARKER = "pyvenv.cfg"
+
+# 需要解析的文件达到该数量时才启用多进程解析（进程启动有固定开销）
+PARALLEL_MIN_FILES = 64
+
+# 并发读取文件的线程数（阻塞读取会释放 GIL，可重叠冷缓存下的 I/O 等待）
+READ_WORKERS = 16
+
+
+def _scan_imports(source: bytes) -> List[str]:
+    """
+    解析源码并提取导入的模块名
+    
+    导入语句只会出现在语句块中，因此只沿语句块（body/handlers/orelse/
+    finalbody/cases）广度优先遍历，跳过表达式子树；结果顺序与 ast.walk 一致。
+    
+    Args:
+        source: Python 源码（字节）
+        
+    Returns:
+        List[str]: 按 AST 遍历顺序排列的导入模块名
+    """
+    imports = []
+    add_import = imports.append
+    import_type, import_from_type = _IMPORT_TYPE, _IMPORT_FROM_TYPE
+    
+    tree = compile(source, "<unknown>", "exec", _AST_ONLY_FLAGS, dont_inherit=True)
+    queue = deque(tree.body)
+    pop_node = queue.popleft
+    add_nodes = queue.extend
+    while queue:
+        node = pop_node()
+        node_type = type(node)
+        if node_type is import_type:
+            for name in node.names:
+                add_import(name.name)
+        elif node_type is import_from_type:
+            if node.module:
+                add_import(node.module)
+        else:
+            for field in _BLOCK_FIELDS:
+                block = getattr(node, field, None)
+                if block:
+                    add_nodes(block)
+    return imports
+
+
+def _read_file_or_none(file_path: str) -> Optional[bytes]:
+    """
+    读取文件内容，读取失败时返回 None
+    
+    读取失败的文件随后由 analyze_file 重新读取并记录错误。
+    
+    Args:
+        file_path: 文件路径
+        
+    Returns:
+        Optional[bytes]: 文件内容，读取失败时为 None
+    """
+    try:
+        with open(file_path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _scan_imports_or_none(source: bytes) -> Optional[List[str]]:
+    """
+    多进程解析用：提取导入列表，解析失败时返回 None
+    
+    解析失败的文件随后由 analyze_file 重新解析并记录错误。
+    
+    Args:
+        source: Python 源码（字节）
+        
+    Returns:
+        Optional[List[str]]: 导入的模块名，解析失败时为 None
+    """
+    try:
+        return _scan_imports(source)
+    except Exception:
+        return None
+
 
 class ArchitectureLinter:
     """
@@ -24,9 +139,23 @@ class ArchitectureLinter:
         """
         self.architecture_config = None
         self.layer_dependencies = {}
+        # (当前层, 导入层) -> 是否允许，覆盖所有已定义层的组合；
+        # 含 unknown 的组合不在表中，一律不检查
+        self._layer_decisions = {}
         self.module_layers = {}
+        # 模块路径 -> 所属层（层定义变化时由 load_config 清空）
+        self._module_layer_cache = {}
         self.violations = []
         self.scanned_modules = 0
+        # 源码中未出现包名、未经解析而跳过的模块数（不计入 scanned_modules）
+        self.skipped_modules = 0
+        # 源码 SHA-256 -> 导入模块名列表（仅保存在内存中，随检查引擎存在；
+        # 不写入被检查的项目，避免缓存被篡改以隐藏违规）
+        self._import_cache = {}
+        # 本次检查中用到的缓存键（检查结束后只保留这些）
+        self._used_cache_keys = set()
+        # 源码包所在目录（含末尾分隔符），由 check_architecture 设置
+        self._source_prefix = None
     
     def load_config(self, config_path: str) -> bool:
         """
@@ -39,20 +168,35 @@ class ArchitectureLinter:
             bool: 加载成功返回 True，否则返回 False
         """
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                self.architecture_config = yaml.safe_load(f)
+            # 以字节流交给 libyaml 解析，不经过文本解码层
+            with open(config_path, "rb") as f:
+                config = yaml.load(f, Loader=_SafeLoader)
+            self.architecture_config = config
+            
+            # 解析层依赖关系与模块层映射（保留配置顺序，使用不可变元组）；
+            # 全部解析成功后才替换现有定义
+            layer_dependencies = {
+                layer["name"]: tuple(layer.get("allowed_dependencies", ()))
+                for layer in config.get("layers", ())
+            }
+            module_layers = {
+                module["name"]: tuple(module.get("layers", ()))
+                for module in config.get("modules", ())
+            }
+            self.layer_dependencies = layer_dependencies
+            self.module_layers = module_layers
             
-            # 解析层依赖关系
-            for layer in self.architecture_config.get("layers", []):
-                layer_name = layer["name"]
-                allowed_deps = layer.get("allowed_dependencies", [])
-                self.layer_dependencies[layer_name] = allowed_deps
+            # 层定义已变化，丢弃已缓存的模块层
+            self._module_layer_cache.clear()
             
-            # 解析模块层映射
-            for module in self.architecture_config.get("modules", []):
-                module_name = module["name"]
-                layers = module.get("layers", [])
-                self.module_layers[module_name] = layers
+            # 预先计算所有层组合的判定结果（层数很少，组合数为 L²）
+            self._layer_decisions = {}
+            for source_layer, source_deps in layer_dependencies.items():
+                allowed = frozenset(source_deps)
+                for target_layer in layer_dependencies:
+                    self._layer_decisions[(source_layer, target_layer)] = (
+                        target_layer == source_layer or target_layer in allowed
+                    )
             
             return True
         except Exception as e:
@@ -69,6 +213,22 @@ class ArchitectureLinter:
         """
         获取模块所属的层
         
+        Args:
+            module_path: 模块路径
+            
+        Returns:
+            str: 模块所属的层，如果无法确定则返回 "unknown"
+        """
+        layer = self._module_layer_cache.get(module_path)
+        if layer is None:
+            layer = self._detect_module_layer(module_path)
+            self._module_layer_cache[module_path] = layer
+        return layer
+    
+    def _detect_module_layer(self, module_path: str) -> str:
+        """
+        根据模块路径判断所属的层（未缓存）
+        
         Args:
             module_path: 模块路径
             
@@ -92,35 +252,32 @@ class ArchitectureLinter:
         
         return "unknown"
     
-    def analyze_file(self, file_path: str) -> None:
+    def analyze_file(self, file_path: str, content: Optional[bytes] = None) -> None:
         """
         分析单个 Python 文件的导入关系
         
         Args:
             file_path: Python 文件路径
+            content: 已读取的文件内容（可选，未提供时从文件读取）
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            if content is None:
+                with open(file_path, "rb") as f:
+                    content = f.read()
+            
+            # 源码中未出现包名时不可能导入该包，无需解析；
+            # 这类文件未经语法检查，单独计入 skipped_modules
+            if _PACKAGE_NAME_BYTES not in content:
+                if self._get_module_path(file_path) is not None:
+                    self.skipped_modules += 1
+                return
             
-            # 解析文件为 AST
-            tree = ast.parse(content)
+            # 提取导入列表（源码未变化时直接复用缓存，无需重新解析）
+            imports = self._get_imports(content)
             
             # 获取当前文件所属的模块
-            # 假设 file_path 是绝对路径，我们需要找到相对于项目根目录的路径
-            # 简单处理：找到 ai_project_os_mcp 作为根模块
-            file_path_parts = file_path.split(os.sep)
-            try:
-                # 找到 ai_project_os_mcp 在路径中的位置
-                mcp_index = file_path_parts.index("ai_project_os_mcp")
-                # 构建相对路径
-                relative_parts = file_path_parts[mcp_index:]
-                # 将路径转换为模块名
-                module_path = ".".join(relative_parts).replace(".py", "")
-                # 移除可能的 __init__ 后缀
-                if module_path.endswith("__init__"):
-                    module_path = module_path[:-8]  # 移除 __init__ 后缀
-            except ValueError:
+            module_path = self._get_module_path(file_path)
+            if module_path is None:
                 # 如果找不到 ai_project_os_mcp，则跳过
                 return
             
@@ -128,15 +285,10 @@ class ArchitectureLinter:
             current_layer = self.get_module_layer(module_path)
             
             # 分析导入语句
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for name in node.names:
-                        imported_module = name.name
-                        self._check_import(current_layer, module_path, imported_module)
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        imported_module = node.module
-                        self._check_import(current_layer, module_path, imported_module)
+            # 大部分导入来自标准库或第三方包，直接跳过，不进入 _check_import
+            for imported_module in imports:
+                if imported_module[:_PACKAGE_NAME_LENGTH] == PACKAGE_NAME:
+                    self._check_import(current_layer, module_path, imported_module)
             
             self.scanned_modules += 1
         except Exception as e:
@@ -148,6 +300,57 @@ class ArchitectureLinter:
                 "message": f"Failed to analyze file: {str(e)}"
             })
     
+    def _get_module_path(self, file_path: str) -> Optional[str]:
+        """
+        将文件路径转换为模块路径
+        
+        位于 check_architecture 源码目录下的文件直接去掉已知前缀转换；
+        其他路径找到 ai_project_os_mcp 作为根模块。
+        
+        Args:
+            file_path: Python 文件路径
+            
+        Returns:
+            Optional[str]: 模块路径，如果找不到 ai_project_os_mcp 则返回 None
+        """
+        prefix = self._source_prefix
+        if prefix is not None and file_path.startswith(prefix):
+            relative_path = file_path[len(prefix):]
+        else:
+            file_path_parts = file_path.split(os.sep)
+            try:
+                # 找到 ai_project_os_mcp 在路径中的位置
+                mcp_index = file_path_parts.index("ai_project_os_mcp")
+            except ValueError:
+                return None
+            relative_path = os.sep.join(file_path_parts[mcp_index:])
+        
+        # 将路径转换为模块名，并移除可能的 __init__ 后缀
+        if relative_path.endswith(".py"):
+            relative_path = relative_path[:-3]
+        module_path = relative_path.replace(os.sep, ".")
+        if module_path.endswith(".__init__"):
+            module_path = module_path[:-9]
+        return module_path
+    
+    def _get_imports(self, content: bytes) -> List[str]:
+        """
+        获取源码的导入列表，优先使用缓存
+        
+        Args:
+            content: Python 源码（字节）
+            
+        Returns:
+            List[str]: 导入的模块名
+        """
+        key = hashlib.sha256(content).hexdigest()
+        imports = self._import_cache.get(key)
+        if imports is None:
+            imports = _scan_imports(content)
+            self._import_cache[key] = imports
+        self._used_cache_keys.add(key)
+        return imports
+    
     def _check_import(self, current_layer: str, current_module: str, imported_module: str) -> None:
         """
         检查导入是否符合架构规则
@@ -158,26 +361,23 @@ class ArchitectureLinter:
             imported_module: 导入的模块路径
         """
         # 只检查 ai_project_os_mcp 内部的模块导入
-        if not imported_module.startswith("ai_project_os_mcp"):
+        if imported_module[:_PACKAGE_NAME_LENGTH] != PACKAGE_NAME:
             return
         
         # 获取导入模块所属的层
         imported_layer = self.get_module_layer(imported_module)
         
-        # 检查层依赖规则
-        if current_layer != "unknown" and imported_layer != "unknown":
-            # 获取当前层允许的依赖
-            allowed_deps = self.layer_dependencies.get(current_layer, [])
-            
-            # 检查导入层是否在允许的依赖列表中
-            if imported_layer not in allowed_deps and current_layer != imported_layer:
-                self.violations.append({
-                    "source": current_module,
-                    "target": imported_module,
-                    "rule_violated": "layer_dependency",
-                    "severity": "ERROR",
-                    "message": f"Layer violation: {current_layer} module {current_module} is not allowed to depend on {imported_layer} module {imported_module}"
-                })
+        # 检查层依赖规则（同层或允许的依赖均通过；未知层不检查）
+        if self._layer_decisions.get((current_layer, imported_layer), True):
+            return
+        
+        self.violations.append({
+            "source": current_module,
+            "target": imported_module,
+            "rule_violated": "layer_dependency",
+            "severity": "ERROR",
+            "message": f"Layer violation: {current_layer} module {current_module} is not allowed to depend on {imported_layer} module {imported_module}"
+        })
     
     def analyze_directory(self, directory_path: str) -> None:
         """
@@ -186,11 +386,122 @@ class ArchitectureLinter:
         Args:
             directory_path: 目录路径
         """
-        for root, _, files in os.walk(directory_path):
-            for file in files:
-                if file.endswith(".py"):
-                    file_path = os.path.join(root, file)
-                    self.analyze_file(file_path)
+        file_paths = self._collect_python_files(directory_path)
+        
+        # 先读取全部文件，读取失败的文件交给 analyze_file 记录错误
+        contents = self._read_files(file_paths)
+        
+        self._parse_in_parallel(contents)
+        
+        # 按遍历顺序检查，保证报告顺序与串行执行一致
+        for file_path, content in zip(file_paths, contents):
+            self.analyze_file(file_path, content)
+    
+    def _collect_python_files(self, directory_path: str) -> List[str]:
+        """
+        收集目录下的所有 Python 文件路径
+        
+        使用 os.scandir 与显式栈遍历，直接复用 DirEntry 的类型信息和路径，
+        避免 os.walk 为每个目录构建列表及逐个 os.path.join。
+        遍历顺序与 os.walk（自顶向下）一致；SKIP_DIRS 中的目录、隐藏目录
+        及虚拟环境目录（含 pyvenv.cfg）不进入。
+        
+        Args:
+            directory_path: 目录路径
+            
+        Returns:
+            List[str]: Python 文件路径列表
+        """
+        file_paths = []
+        stack = [directory_path]
+        while stack:
+            subdirs = []
+            dir_files = []
+            is_venv = False
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if is_dir:
+                            name = entry.name
+                            if name in SKIP_DIRS or name.startswith("."):
+                                continue
+                            # 与 os.walk 默认行为一致，不进入符号链接目录
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        elif entry.name.endswith(".py"):
+                            dir_files.append(entry.path)
+                        elif entry.name == _VENV_MARKER:
+                            is_venv = True
+            except OSError:
+                # 与 os.walk 一样忽略无法读取的目录
+                continue
+            # 虚拟环境目录整体跳过（标记文件可能在扫描后期才出现，故扫描完再决定）
+            if is_venv:
+                continue
+            file_paths.extend(dir_files)
+            # 逆序入栈，使子目录按扫描顺序依次处理
+            stack.extend(reversed(subdirs))
+        return file_paths
+    
+    def _read_files(self, file_paths: List[str]) -> List[Optional[bytes]]:
+        """
+        批量读取文件内容
+        
+        文件较多时用线程池并发读取，使各文件的 open/read 等待相互重叠；
+        文件少于 PARALLEL_MIN_FILES 或线程池不可用时串行读取。
+        
+        Args:
+            file_paths: 文件路径列表
+            
+        Returns:
+            List[Optional[bytes]]: 与 file_paths 一一对应的内容（读取失败的为 None）
+        """
+        if len(file_paths) >= PARALLEL_MIN_FILES:
+            try:
+                with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+                    return list(executor.map(_read_file_or_none, file_paths))
+            except RuntimeError:
+                # 无法创建线程（解释器关闭中等），回退为串行读取
+                pass
+        return [_read_file_or_none(file_path) for file_path in file_paths]
+    
+    def _parse_in_parallel(self, contents: List[Optional[bytes]]) -> None:
+        """
+        用多进程解析尚未缓存的源码，并将结果写入导入缓存
+        
+        需要解析的文件少于 PARALLEL_MIN_FILES 时不做任何事；
+        进程池不可用时同样回退为串行解析。
+        
+        Args:
+            contents: 文件内容列表（读取失败的为 None）
+        """
+        pending = {}
+        for content in contents:
+            if content is None or _PACKAGE_NAME_BYTES not in content:
+                continue
+            key = hashlib.sha256(content).hexdigest()
+            if key not in self._import_cache:
+                pending[key] = content
+        
+        if len(pending) < PARALLEL_MIN_FILES:
+            return
+        
+        try:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(
+                    _scan_imports_or_none, pending.values(), chunksize=16
+                ))
+        except Exception:
+            # 无法创建进程池（受限环境等），由 analyze_file 串行解析
+            return
+        
+        for key, imports in zip(pending, results):
+            if imports is not None:
+                self._import_cache[key] = imports
     
     def get_report(self) -> Dict:
         """
@@ -210,6 +521,7 @@ class ArchitectureLinter:
             "violations": self.violations,
             "allowed_edges": allowed_edges,
             "scanned_modules": self.scanned_modules,
+            "skipped_modules": self.skipped_modules,
             "timestamp": "2023-01-01T12:00:00Z"
         }
     
@@ -226,15 +538,21 @@ class ArchitectureLinter:
         # 重置状态
         self.violations = []
         self.scanned_modules = 0
+        self.skipped_modules = 0
         
         # 加载配置
         config_path = os.path.join(project_root, "architecture.yaml")
         if not self.load_config(config_path):
             return self.get_report()
         
-        # 分析项目代码
+        # 分析项目代码（同一检查引擎再次检查时，未变化的文件复用上次的导入分析结果）
+        self._used_cache_keys = set()
         source_dir = os.path.join(project_root, "ai_project_os_mcp")
+        self._source_prefix = os.path.join(os.path.dirname(source_dir), "")
         self.analyze_directory(source_dir)
+        
+        # 丢弃本次未用到的分析结果（已删除或已修改的文件）
+        self._import_cache = {key: self._import_cache[key] for key in self._used_cache_keys}
 
         return self.get_report()
 
@@ -6,12 +6,71 @@ Auth - 认证与授权模块
 2. Agent 权限管理
 """
 
-import hashlib
+import base64
+import heapq
+import hmac
 import time
 import secrets
-from datetime import datetime, timedelta
+import threading
 from typing import Dict, Optional, Tuple
 
+
+def _b64encode(data: bytes) -> str:
+    """
+    base64url 编码（无填充）
+    
+    Args:
+        data: 原始字节
+        
+    Returns:
+        str: 编码后的字符串
+    """
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    """
+    base64url 解码（补齐填充），拒绝字母表之外的字符
+    
+    Args:
+        data: 编码后的字符串
+        
+    Returns:
+        bytes: 原始字节
+    """
+    return base64.b64decode(data + "=" * (-len(data) % 4), altchars=b"-_", validate=True)
+
+
+def _sign(secret: bytes, payload: bytes) -> bytes:
+    """
+    计算载荷的 HMAC-SHA256 签名
+    
+    Args:
+        secret: Agent 密钥
+        payload: 待签名的载荷
+        
+    Returns:
+        bytes: 签名
+    """
+    return hmac.new(secret, payload, "sha256").digest()
+
+
+def _copy_agent_info(agent_info: Dict) -> Dict:
+    """
+    复制 Agent 信息（含权限列表），使调用方修改结果不会影响内部数据
+    
+    Args:
+        agent_info: Agent 信息
+        
+    Returns:
+        Dict: Agent 信息副本
+    """
+    agent_copy = dict(agent_info)
+    if "permissions" in agent_copy:
+        agent_copy["permissions"] = list(agent_copy["permissions"])
+    return agent_copy
+
+
 class AuthManager:
     """
     认证管理类，负责 Token 生成、验证和权限管理
@@ -21,30 +80,41 @@ class AuthManager:
         """
         初始化认证管理器
         """
-        # 存储 Agent 信息
+        # 存储 Agent 信息（密钥在首次使用时由 _get_secret 生成）
         self.agents = {
             "planner": {
                 "name": "Planner Agent",
                 "role": "planner",
                 "permissions": ["read_state", "write_state", "run_tests", "analyze_dependencies"],
-                "secret": secrets.token_hex(32)
+                "secret": None
             },
             "coder": {
                 "name": "Coder Agent",
                 "role": "coder",
                 "permissions": ["write_code", "run_tests", "submit_audit"],
-                "secret": secrets.token_hex(32)
+                "secret": None
             },
             "reviewer": {
                 "name": "Reviewer Agent",
                 "role": "reviewer",
                 "permissions": ["read_code", "verify_audit", "run_tests"],
-                "secret": secrets.token_hex(32)
+                "secret": None
             }
         }
         
-        # 存储 Token 信息
-        self.tokens = {}
+        # 保护密钥的首次生成，避免并发请求为同一 Agent 生成不同密钥
+        self._secret_lock = threading.Lock()
+        
+        # 不含密钥的 Agent 公开信息（按需由 _get_public_info 构建并缓存）
+        self._agents_public = {}
+        
+        # Agent 权限集合（按需由 permissions 列表构建，O(1) 成员判断）
+        self._permission_sets = {}
+        
+        # 已撤销 Token 的签名 -> 过期时间（Token 自包含签名，服务端只记录撤销）
+        self._revoked = {}
+        # 撤销记录按过期时间排列的最小堆 [(expiry, signature)]，清理时只弹出已过期的前缀
+        self._revoked_expiry_heap = []
         
         # Token 有效期（小时）
         self.token_expiry_hours = 24
@@ -63,75 +133,125 @@ class AuthManager:
             return None, f"Unknown agent: {agent_id}"
         
         # 生成 Token
-        # 格式: agent_id:timestamp:signature
+        # 格式: base64url(agent_id|timestamp|expiry).base64url(signature)
         timestamp = int(time.time())
-        secret = self.agents[agent_id]["secret"]
+        expiry = timestamp + (self.token_expiry_hours * 3600)
+        payload = f"{agent_id}|{timestamp}|{expiry}".encode("utf-8")
+        signature = _sign(self._get_secret(agent_id), payload)
         
-        # 生成签名
-        message = f"{agent_id}:{timestamp}"
-        signature = hashlib.sha256(f"{message}:{secret}".encode("utf-8")).hexdigest()
+        token = f"{_b64encode(payload)}.{_b64encode(signature)}"
         
-        token = f"{agent_id}:{timestamp}:{signature}"
+        return token, None
+    
+    def _get_secret(self, agent_id: str) -> Optional[bytes]:
+        """
+        获取 Agent 密钥，首次使用时生成
         
-        # 存储 Token 信息
-        self.tokens[token] = {
-            "agent_id": agent_id,
-            "timestamp": timestamp,
-            "expiry": timestamp + (self.token_expiry_hours * 3600),
-            "last_used": timestamp
-        }
+        Args:
+            agent_id: Agent ID
+            
+        Returns:
+            Optional[bytes]: Agent 密钥，若 Agent 不存在则返回 None
+        """
+        agent = self.agents.get(agent_id)
+        if agent is None:
+            return None
         
-        return token, None
+        secret = agent["secret"]
+        if secret is None:
+            with self._secret_lock:
+                # 加锁后再次检查：其他线程可能已生成密钥
+                secret = agent["secret"]
+                if secret is None:
+                    secret = agent["secret"] = secrets.token_bytes(32)
+        return secret
+    
+    def _get_public_info(self, agent_id: str) -> Optional[Dict]:
+        """
+        获取不含密钥的 Agent 公开信息，首次使用时构建并缓存
+        
+        Args:
+            agent_id: Agent ID
+            
+        Returns:
+            Optional[Dict]: Agent 公开信息（内部缓存，不可直接交给调用方），若 Agent 不存在则返回 None
+        """
+        public_info = self._agents_public.get(agent_id)
+        if public_info is None:
+            agent = self.agents.get(agent_id)
+            if agent is None:
+                return None
+            public_info = {k: v for k, v in agent.items() if k != "secret"}
+            self._agents_public[agent_id] = public_info
+        return public_info
+    
+    def _decode_token(self, token: str) -> Tuple[Optional[Tuple[str, int, bytes]], Optional[str]]:
+        """
+        解析 Token 并验证签名
+        
+        只接受规范编码的 Token：同一载荷与签名只有一种合法写法，
+        避免通过改写编码绕过撤销记录。
+        
+        Args:
+            token: 要解析的 Token
+            
+        Returns:
+            Tuple[Optional[Tuple[str, int, bytes]], Optional[str]]: ((Agent ID, 过期时间, 签名), 错误信息)
+        """
+        try:
+            encoded_payload, encoded_signature = token.split(".")
+            payload = _b64decode(encoded_payload)
+            signature = _b64decode(encoded_signature)
+            if _b64encode(payload) != encoded_payload or _b64encode(signature) != encoded_signature:
+                return None, "Invalid token format"
+            agent_id, _, expiry = payload.decode("utf-8").rsplit("|", 2)
+            expiry = int(expiry)
+        except Exception:
+            return None, "Invalid token format"
+        
+        agent_secret = self._get_secret(agent_id)
+        if agent_secret is None:
+            return None, "Invalid token"
+        
+        # 常量时间比较，避免时序侧信道
+        if not hmac.compare_digest(signature, _sign(agent_secret, payload)):
+            return None, "Invalid token signature"
+        
+        return (agent_id, expiry, signature), None
     
     def verify_token(self, token: str) -> Tuple[Optional[Dict], Optional[str]]:
         """
         验证 Token 有效性
         
+        Token 自包含 Agent ID 与过期时间，签名即有效性依据，无需查询服务端状态。
+        
         Args:
             token: 要验证的 Token
             
         Returns:
             Tuple[Optional[Dict], Optional[str]]: (Agent 信息, 错误信息)
         """
-        if token not in self.tokens:
-            return None, "Invalid token"
+        claims, error = self._decode_token(token)
+        if error:
+            return None, error
         
-        token_info = self.tokens[token]
-        agent_id = token_info["agent_id"]
+        agent_id, expiry, signature = claims
         
         # 检查 Token 是否过期
-        if time.time() > token_info["expiry"]:
-            del self.tokens[token]
+        if time.time() > expiry:
             return None, "Token expired"
         
-        # 验证 Token 签名
-        agent_secret = self.agents[agent_id]["secret"]
-        try:
-            parts = token.split(":")
-            if len(parts) != 3:
-                del self.tokens[token]
-                return None, "Invalid token format"
-            
-            token_agent_id, token_timestamp, token_signature = parts
-            message = f"{token_agent_id}:{token_timestamp}"
-            expected_signature = hashlib.sha256(f"{message}:{agent_secret}".encode("utf-8")).hexdigest()
-            
-            if token_signature != expected_signature:
-                del self.tokens[token]
-                return None, "Invalid token signature"
-        except Exception:
-            del self.tokens[token]
-            return None, "Invalid token format"
-        
-        # 更新 Token 最后使用时间
-        self.tokens[token]["last_used"] = int(time.time())
+        # 检查 Token 是否已撤销
+        if signature in self._revoked:
+            return None, "Invalid token"
         
-        # 返回 Agent 信息
-        agent_info = self.agents[agent_id].copy()
-        # 不返回密钥
-        agent_info.pop("secret")
+        # 返回 Agent 信息（不含密钥）
+        public_info = self._get_public_info(agent_id)
+        if public_info is None:
+            return None, "Invalid token"
+        agent_info = _copy_agent_info(public_info)
         agent_info["token"] = token
-        agent_info["expiry"] = token_info["expiry"]
+        agent_info["expiry"] = expiry
         
         return agent_info, None
     
@@ -145,10 +265,17 @@ class AuthManager:
         Returns:
             bool: 撤销成功返回 True，否则返回 False
         """
-        if token in self.tokens:
-            del self.tokens[token]
-            return True
-        return False
+        claims, error = self._decode_token(token)
+        if error:
+            return False
+        
+        _, expiry, signature = claims
+        if time.time() > expiry or signature in self._revoked:
+            return False
+        
+        self._revoked[signature] = expiry
+        heapq.heappush(self._revoked_expiry_heap, (expiry, signature))
+        return True
     
     def check_permission(self, agent_id: str, action: str) -> bool:
         """
@@ -161,11 +288,15 @@ class AuthManager:
         Returns:
             bool: 有权限返回 True，否则返回 False
         """
-        if agent_id not in self.agents:
-            return False
+        permissions = self._permission_sets.get(agent_id)
+        if permissions is None:
+            agent = self.agents.get(agent_id)
+            if agent is None:
+                return False
+            permissions = frozenset(agent.get("permissions", []))
+            self._permission_sets[agent_id] = permissions
         
-        agent = self.agents[agent_id]
-        return action in agent.get("permissions", [])
+        return action in permissions
     
     def get_agent_permissions(self, agent_id: str) -> Optional[list]:
         """
@@ -189,34 +320,32 @@ class AuthManager:
         Returns:
             Dict: Agent 列表
         """
-        agents_list = {}
-        for agent_id, agent_info in self.agents.items():
-            # 不返回密钥
-            safe_info = agent_info.copy()
-            safe_info.pop("secret")
-            agents_list[agent_id] = safe_info
-        
-        return agents_list
+        # 不返回密钥；返回副本，调用方修改结果不会影响内部数据
+        return {
+            agent_id: _copy_agent_info(self._get_public_info(agent_id))
+            for agent_id in self.agents
+        }
     
     def cleanup_expired_tokens(self) -> int:
         """
-        清理过期 Token
+        清理过期 Token 的撤销记录
+
+        过期 Token 本身即无法通过验证，撤销记录在过期后不再需要。
 
         Returns:
             int: 清理的 Token 数量
         """
         current_time = int(time.time())
-        expired_tokens = []
-
-        for token, token_info in self.tokens.items():
-            if current_time > token_info["expiry"]:
-                expired_tokens.append(token)
+        heap = self._revoked_expiry_heap
+        cleaned = 0
 
-        # 删除过期 Token
-        for token in expired_tokens:
-            del self.tokens[token]
+        # 只弹出已过期的记录，未过期的撤销记录无需扫描
+        while heap and current_time > heap[0][0]:
+            _, signature = heapq.heappop(heap)
+            del self._revoked[signature]
+            cleaned += 1
 
-        return len(expired_tokens)
+        return cleaned
 
 
 __all__ = []
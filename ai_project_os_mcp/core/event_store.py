@@ -6,13 +6,12 @@ EventStore is the single source of truth for all governance events.
 Events are append-only and cannot be modified or deleted.
 """
 
-from typing import Optional, List, Dict, Any
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from pydantic import BaseModel
-import uuid
+from typing import Optional, List, Dict, Tuple
 from abc import ABC, abstractmethod
 
-from .events import GovernanceEvent
+from .events import EventType, GovernanceEvent
 
 
 class EventStore(ABC):
@@ -62,6 +61,7 @@ class EventStore(ABC):
                 - actor_id: Actor ID to filter by
                 - start_time: Start time to filter by
                 - end_time: End time to filter by
+                - limit: Maximum number of (newest) events to return
             
         Returns:
             List[GovernanceEvent]: List of matching events, sorted by timestamp descending
@@ -94,6 +94,16 @@ class InMemoryEventStore(EventStore):
         Initialize the in-memory event store
         """
         self.events: Dict[str, GovernanceEvent] = {}
+        
+        # Secondary indexes, each list in append order
+        self._events_by_type: Dict[EventType, List[GovernanceEvent]] = {}
+        self._events_by_actor: Dict[str, List[GovernanceEvent]] = {}
+        
+        # Events ordered by timestamp, with equal timestamps latest-appended
+        # first, so reading it backwards gives list() order directly; the
+        # timestamps are kept alongside for bisect
+        self._timeline: List[GovernanceEvent] = []
+        self._timeline_keys: List[datetime] = []
     
     def append(self, event: GovernanceEvent) -> bool:
         """
@@ -111,8 +121,17 @@ class InMemoryEventStore(EventStore):
         if event.id in self.events:
             return False
         
+        # 先定位时间线插入点：时间戳无法比较（如时区混用）时抛出，此时尚未写入任何数据
+        position = bisect_left(self._timeline_keys, event.timestamp)
+        
         # 写入事件（append-only）
         self.events[event.id] = event
+        
+        # 更新索引
+        self._events_by_type.setdefault(event.event_type, []).append(event)
+        self._events_by_actor.setdefault(event.actor.id, []).append(event)
+        self._timeline.insert(position, event)
+        self._timeline_keys.insert(position, event.timestamp)
         return True
     
     def get(self, event_id: str) -> Optional[GovernanceEvent]:
@@ -137,31 +156,20 @@ class InMemoryEventStore(EventStore):
                 - actor_id: Actor ID to filter by
                 - start_time: Start time to filter by
                 - end_time: End time to filter by
+                - limit: Maximum number of (newest) events to return
             
         Returns:
             List[GovernanceEvent]: List of matching events, sorted by timestamp descending
         """
-        results = list(self.events.values())
-        
-        # Apply filters
-        if "event_type" in filters:
-            event_type = filters["event_type"]
-            results = [e for e in results if e.event_type == event_type]
-        
-        if "actor_id" in filters:
-            actor_id = filters["actor_id"]
-            results = [e for e in results if e.actor.id == actor_id]
-        
-        if "start_time" in filters:
-            start_time = filters["start_time"]
-            results = [e for e in results if e.timestamp >= start_time]
+        results, newest_first = self._select(filters)
+        if not newest_first:
+            # Sort by timestamp (newest first)
+            results = sorted(results, key=lambda x: x.timestamp, reverse=True)
         
-        if "end_time" in filters:
-            end_time = filters["end_time"]
-            results = [e for e in results if e.timestamp <= end_time]
-        
-        # Sort by timestamp (newest first)
-        return sorted(results, key=lambda x: x.timestamp, reverse=True)
+        limit = filters.get("limit")
+        if limit is not None:
+            results = results[:limit]
+        return results
     
     def count(self, **filters) -> int:
         """
@@ -173,7 +181,91 @@ class InMemoryEventStore(EventStore):
         Returns:
             int: Number of matching events
         """
-        return len(self.list(**filters))
+        if not filters:
+            return len(self.events)
+        
+        # Only the size matters, so skip the sort done by list()
+        results, _ = self._select(filters)
+        limit = filters.get("limit")
+        if limit is not None:
+            return min(len(results), limit)
+        return len(results)
+    
+    def _select(self, filters: Dict) -> Tuple[List[GovernanceEvent], bool]:
+        """
+        Find the events matching the filters, using the indexes
+        
+        Args:
+            filters: Filter criteria (same as list method)
+            
+        Returns:
+            Tuple[List[GovernanceEvent], bool]: Matching events, and whether
+            they are already sorted by timestamp descending (the list may be
+            an index list and must not be modified)
+        """
+        # Time range as a slice of the timeline
+        start = 0
+        stop = len(self._timeline)
+        if "start_time" in filters:
+            start = bisect_left(self._timeline_keys, filters["start_time"])
+        if "end_time" in filters:
+            stop = bisect_right(self._timeline_keys, filters["end_time"])
+        
+        # Start from the smallest candidate set: the time range, or the
+        # event type / actor postings list
+        seed = None
+        if "event_type" in filters:
+            seed = "event_type"
+            results = self._events_by_type.get(filters["event_type"], [])
+        if "actor_id" in filters:
+            by_actor = self._events_by_actor.get(filters["actor_id"], [])
+            if seed is None or len(by_actor) < len(results):
+                seed = "actor_id"
+                results = by_actor
+        if seed is None or stop - start <= len(results):
+            limit = filters.get("limit")
+            if seed is None and limit is not None and limit >= 0:
+                # Nothing else to filter: only the newest entries are needed
+                start = max(start, stop - limit)
+            seed = "time"
+            results = self._timeline[start:stop][::-1]
+        
+        # Apply the remaining filters, the one expected to match fewest
+        # events first, so that later passes walk the shortest list
+        remaining = []
+        if "event_type" in filters and seed != "event_type":
+            by_type = self._events_by_type.get(filters["event_type"], [])
+            remaining.append((len(by_type), "event_type"))
+        if "actor_id" in filters and seed != "actor_id":
+            by_actor = self._events_by_actor.get(filters["actor_id"], [])
+            remaining.append((len(by_actor), "actor_id"))
+        if seed != "time" and ("start_time" in filters or "end_time" in filters):
+            remaining.append((stop - start, "time"))
+        remaining.sort()
+        
+        for _, name in remaining:
+            if not results:
+                break
+            if name == "event_type":
+                event_type = filters["event_type"]
+                results = [e for e in results if e.event_type == event_type]
+            elif name == "actor_id":
+                actor_id = filters["actor_id"]
+                results = [e for e in results if e.actor.id == actor_id]
+            elif "start_time" not in filters:
+                end_time = filters["end_time"]
+                results = [e for e in results if e.timestamp <= end_time]
+            elif "end_time" not in filters:
+                start_time = filters["start_time"]
+                results = [e for e in results if e.timestamp >= start_time]
+            else:
+                # Both bounds in a single pass
+                start_time = filters["start_time"]
+                end_time = filters["end_time"]
+                results = [e for e in results if start_time <= e.timestamp <= end_time]
+        
+        # Timeline order is already newest first
+        return results, seed == "time"
 
 
 # Global in-memory event store for development
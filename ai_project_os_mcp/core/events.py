@@ -5,8 +5,8 @@ Governance Events - Enhanced Event Model with Agent Identity
 from datetime import datetime
 from enum import Enum
 from pydantic import BaseModel, Field
-from typing import Dict, Optional, Any, List, Literal
-import uuid
+from typing import Dict, Optional, Any, Literal
+from .ids import new_uuid4
 
 
 class EventType(str, Enum):
@@ -44,7 +44,7 @@ class GovernanceEvent(BaseModel):
     actor: Actor = Field(..., description="Actor who triggered the event")
     payload: Dict[str, Any] = Field(default_factory=dict, description="Event-specific payload")
     timestamp: datetime = Field(default_factory=datetime.now, description="Event timestamp")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique event identifier")
+    id: str = Field(default_factory=new_uuid4, description="Unique event identifier")
     
     class Config:
         extra = "forbid"  # Strict validation, no extra fields allowed
@@ -2,6 +2,7 @@
 Governance Engine - Core v2.5 implementation
 """
 
+from collections import Counter
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
@@ -10,9 +11,23 @@ from .event_store import get_event_store
 from .violation import GovernanceViolation, ViolationLevel
 from .policy_engine import PolicyEngine, ActionType, Action
 from .score_engine import ScoreEngine
-from .state_manager import StateManager
+from .state_manager import StateManager, StateWriteError
 from .trigger_engine import TriggerEngine
 
+# Violation levels that make an event fail
+BLOCKING_LEVELS = frozenset({ViolationLevel.CRITICAL, ViolationLevel.MAJOR})
+
+# Frozen state set by each action type / event type (others leave it unchanged)
+ACTION_FROZEN_STATE = {
+    ActionType.FREEZE_PROJECT: True,
+    ActionType.UNFREEZE_PROJECT: False
+}
+
+EVENT_FROZEN_STATE = {
+    EventType.FREEZE_REQUEST: True,
+    EventType.UNFREEZE: False
+}
+
 
 class GovernanceEngine:
     """
@@ -56,17 +71,12 @@ class GovernanceEngine:
         """
         Ensure required state fields exist
         """
-        if "score" not in self.state:
-            self.state["score"] = {
-                "global": 100,  # Irreversible,跨阶段
-                "stage": 100    # 阶段内评分，阶段切换时重置
-            }
-        
-        if "is_frozen" not in self.state:
-            self.state["is_frozen"] = False
-        
-        if "events" not in self.state:
-            self.state["events"] = []
+        self.state.setdefault("score", {
+            "global": 100,  # Irreversible,跨阶段
+            "stage": 100    # 阶段内评分，阶段切换时重置
+        })
+        self.state.setdefault("is_frozen", False)
+        self.state.setdefault("events", [])
     
     def handle_event(self, event: GovernanceEvent) -> Dict[str, Any]:
         """
@@ -79,8 +89,10 @@ class GovernanceEngine:
             Processed event result with violations, score, and actions
         """
         # 1. Validate actor identity (必改：无 Actor 的 Event 直接拒绝)
+        # Rejection violations are built from constants and the already
+        # validated event, so they skip model validation
         if not event.actor:
-            violation = GovernanceViolation(
+            violation = GovernanceViolation.model_construct(
                 level=ViolationLevel.CRITICAL,
                 rule_id="anonymous_event",
                 event_id=event.id,
@@ -97,7 +109,7 @@ class GovernanceEngine:
         # 2. Check frozen state (必改：Frozen 状态下，只接受 UNFREEZE / STATUS 事件)
         if self.state["is_frozen"]:
             if event.event_type not in [EventType.UNFREEZE, EventType.STATUS]:
-                violation = GovernanceViolation(
+                violation = GovernanceViolation.model_construct(
                     level=ViolationLevel.CRITICAL,
                     rule_id="frozen_project",
                     event_id=event.id,
@@ -124,28 +136,56 @@ class GovernanceEngine:
         score_update = self.score_engine.update(event, violations, self.state)
         
         # 7. Apply actions and update state in transaction (Phase A3)
-        with self._governance_transaction():
-            # 检查是否有 CRITICAL 违规，如果有，直接冻结项目
-            has_critical_violation = any(v["level"] == ViolationLevel.CRITICAL for v in violations)
-            if has_critical_violation:
-                self.state["is_frozen"] = True
-            
-            self._apply_actions(actions, event)
-            self._update_state(event, violations, actions, score_update)
-            # 8. Write audit record (新增：必改 - 所有事件必须有审计记录)
-            self._write_audit(event, violations, actions, score_update)
+        # Saves inside the transaction are coalesced into a single write
+        state_error = None
+        try:
+            with self.state_manager.batch_writes(), self._governance_transaction():
+                # 检查是否有 CRITICAL 违规，如果有，直接冻结项目
+                has_critical_violation = any(v["level"] == ViolationLevel.CRITICAL for v in violations)
+                if has_critical_violation:
+                    self.state["is_frozen"] = True
+                
+                self._apply_actions(actions, event)
+                self._update_state(event, violations, actions, score_update)
+                # 8. Write audit record (新增：必改 - 所有事件必须有审计记录)
+                self._write_audit(event, violations, actions, score_update)
+        except StateWriteError as e:
+            # The governance decision stands; report that it was not persisted
+            state_error = str(e)
         
         # 9. Create result
         result = {
             "event_id": event.id,
-            "status": "FAILED" if any(v["level"] in [ViolationLevel.CRITICAL, ViolationLevel.MAJOR] for v in violations) else "PASSED",
+            "status": "FAILED" if any(v["level"] in BLOCKING_LEVELS for v in violations) else "PASSED",
             "violations": violations,
             "actions": actions,
             "score": score_update
         }
+        if state_error:
+            result["state_error"] = state_error
         
         return result
     
+    def handle_events(self, events: List[GovernanceEvent]) -> List[Dict[str, Any]]:
+        """
+        Process a burst of governance events with a single state write
+        
+        Each event goes through handle_event in order; their state saves
+        are coalesced so the state file and history are written once for
+        the whole burst instead of once per event.
+        
+        Args:
+            events: Governance events to process, in order
+            
+        Returns:
+            Processed event results, one per event
+            
+        Raises:
+            StateWriteError: If the coalesced state write for the burst failed
+        """
+        with self.state_manager.batch_writes():
+            return [self.handle_event(event) for event in events]
+    
     def _governance_transaction(self):
         """
         Governance transaction context manager to ensure atomicity
@@ -177,48 +217,17 @@ class GovernanceEngine:
             actions: List of structured actions to apply
             event: Original event
         """
-        for action in actions:
-            if action.type == ActionType.FREEZE_PROJECT:
-                self.state["is_frozen"] = True
-            elif action.type == ActionType.UNFREEZE_PROJECT:
-                self.state["is_frozen"] = False
-            
-        # 特殊处理：如果是 FREEZE_REQUEST 事件，直接冻结项目
-        if event.event_type == EventType.FREEZE_REQUEST:
-            self.state["is_frozen"] = True
-        # 特殊处理：如果是 UNFREEZE 事件，直接解冻项目
-        elif event.event_type == EventType.UNFREEZE:
-            self.state["is_frozen"] = False
-    
-    def _update_state(self, event: GovernanceEvent, violations: List[Dict[str, Any]], 
-                     actions: List[Dict[str, Any]], score_update: Dict[str, Any]):
-        """
-        Update project state based on event, violations, and actions
-        
-        Args:
-            event: Processed event
-            violations: Detected violations
-            actions: Applied actions
-            score_update: Updated score
-        """
-        # Update score
-        self.state["score"] = score_update
-        
-        # Add event to state (for quick access, but EventStore is the source of truth)
-        self.state["events"].append({
-            "event_id": event.event_id,
-            "event_type": event.event_type,
-            "timestamp": event.timestamp.isoformat(),
-            "actor_id": event.actor.id
-        })
-        
-        # Update violation count
-        violation_count = {
-            "critical": len([v for v in violations if v["level"] == ViolationLevel.CRITICAL]),
-            "major": len([v for v in violations if v["level"] == ViolationLevel.MAJOR]),
-            "minor": len([v for v in violations if v["level"] == ViolationLevel.MINOR])
-        }
-        self.state["violation_count"] = violation_count
+        # The last freeze/unfreeze action wins
+        for action in reversed(actions):
+            is_frozen = ACTION_FROZEN_STATE.get(action.type)
+            if is_frozen is not None:
+                self.state["is_frozen"] = is_frozen
+                break
+        
+        # 特殊处理：FREEZE_REQUEST 事件直接冻结项目，UNFREEZE 事件直接解冻项目
+        is_frozen = EVENT_FROZEN_STATE.get(event.event_type)
+        if is_frozen is not None:
+            self.state["is_frozen"] = is_frozen
     
     def get_state(self) -> Dict[str, Any]:
         """
@@ -239,7 +248,7 @@ class GovernanceEngine:
         Returns:
             List of events
         """
-        events = self.event_store.list()[:limit]
+        events = self.event_store.list(limit=limit)
         return [event.model_dump() for event in events]
     
     def _validate_event(self, event: Dict[str, Any]) -> bool:
@@ -308,12 +317,25 @@ class GovernanceEngine:
         })
         
         # Update violation count
-        violation_count = {
-            "critical": len([v for v in violations if v["level"] == ViolationLevel.CRITICAL]),
-            "major": len([v for v in violations if v["level"] == ViolationLevel.MAJOR]),
-            "minor": len([v for v in violations if v["level"] == ViolationLevel.MINOR])
+        self.state["violation_count"] = self._count_violations(violations)
+    
+    @staticmethod
+    def _count_violations(violations: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Count violations per level in a single pass
+        
+        Args:
+            violations: Detected violations
+            
+        Returns:
+            Counts keyed by "critical", "major" and "minor"
+        """
+        counts = Counter(v["level"] for v in violations)
+        return {
+            "critical": counts[ViolationLevel.CRITICAL],
+            "major": counts[ViolationLevel.MAJOR],
+            "minor": counts[ViolationLevel.MINOR]
         }
-        self.state["violation_count"] = violation_count
     
     def _write_audit(self, event: GovernanceEvent, violations: List[Dict[str, Any]], 
                     actions: List[Dict[str, Any]], score_update: Dict[str, Any]):
@@ -328,10 +350,6 @@ class GovernanceEngine:
         
         🔒 铁律：所有事件必须有审计记录，且必须引用event_id
         """
-        # Ensure audit field exists in state
-        if "audit" not in self.state:
-            self.state["audit"] = []
-        
         # Create audit record
         audit_record = {
             "event_id": event.id,
@@ -343,7 +361,7 @@ class GovernanceEngine:
                 "role_type": event.actor.role_type,
                 "source": event.actor.source
             },
-            "status": "FAILED" if any(v["level"] in [ViolationLevel.CRITICAL, ViolationLevel.MAJOR] for v in violations) else "PASSED",
+            "status": "FAILED" if any(v["level"] in BLOCKING_LEVELS for v in violations) else "PASSED",
             "violations": violations,
             "actions": actions,
             "score_change": {
@@ -354,7 +372,7 @@ class GovernanceEngine:
         }
         
         # Add audit record to state (for quick access, but EventStore is the source of truth)
-        self.state["audit"].append(audit_record)
+        self.state.setdefault("audit", []).append(audit_record)
         
         # Save updated state
         self.state_manager.save_state(self.state)
@@ -376,13 +394,9 @@ class GovernanceEngine:
         """
         result = {
             "event_id": event["event_id"],
-            "status": "FAILED" if any(v["level"] in [ViolationLevel.CRITICAL, ViolationLevel.MAJOR] for v in violations) else "PASSED",
+            "status": "FAILED" if any(v["level"] in BLOCKING_LEVELS for v in violations) else "PASSED",
             "violations": violations,
-            "violation_count": {
-                "critical": len([v for v in violations if v["level"] == ViolationLevel.CRITICAL]),
-                "major": len([v for v in violations if v["level"] == ViolationLevel.MAJOR]),
-                "minor": len([v for v in violations if v["level"] == ViolationLevel.MINOR])
-            }
+            "violation_count": self._count_violations(violations)
         }
         
         if audit_record:
@@ -393,15 +407,6 @@ class GovernanceEngine:
         
         return result
     
-    def get_state(self) -> Dict[str, Any]:
-        """
-        Get current project state
-        
-        Returns:
-            Current project state
-        """
-        return self.state
-    
     def get_audit_history(self) -> List[Dict[str, Any]]:
         """
         Get audit history
@@ -0,0 +1,58 @@
+"""
+Identifier Generation
+
+This module generates the random identifiers used by governance events
+and violations.
+
+uuid.uuid4() reads 16 bytes from os.urandom() for every call. Here the
+randomness is fetched in one larger batch and sliced, so the syscall is
+paid once per batch. Identifiers keep the canonical version 4 UUID
+string format.
+"""
+
+import os
+import threading
+
+# Number of identifiers drawn from a single os.urandom() call
+ID_BATCH_SIZE = 4096
+
+_lock = threading.Lock()
+_buffer = b""
+_offset = 0
+
+
+def _reset_buffer():
+    """
+    Drop buffered randomness so a forked child never reuses the parent's bytes
+    """
+    global _buffer, _offset
+    _buffer = b""
+    _offset = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_buffer)
+
+
+def new_uuid4() -> str:
+    """
+    Generate a random version 4 UUID string
+
+    Returns:
+        str: UUID in canonical 8-4-4-4-12 form, as str(uuid.uuid4())
+    """
+    global _buffer, _offset
+    with _lock:
+        offset = _offset
+        if offset >= len(_buffer):
+            _buffer = os.urandom(16 * ID_BATCH_SIZE)
+            offset = 0
+        _offset = offset + 16
+        raw = _buffer[offset:offset + 16]
+
+    # Set the version (4) and RFC 4122 variant bits while formatting
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
+
+
+__all__ = []
@@ -4,10 +4,15 @@ Policy Engine - Policy interpreter for governance actions
 
 import yaml
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pydantic import BaseModel, Field
 from enum import Enum
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 class ActionType(str, Enum):
     """Types of governance actions"""
@@ -58,32 +63,47 @@ class PolicyEngine:
     
     def __init__(self, policies_dir: str = "policies"):
         self.policies_dir = policies_dir
-        self.policies = []
+        # Loaded policies (read-only; replaced as a whole by load_policies)
+        self._policies = ()
+        # The same policies in priority order, rebuilt by load_policies
+        self._sorted_policies = []
         self.load_policies()
     
+    @property
+    def policies(self) -> Tuple[GovernancePolicy, ...]:
+        """Loaded policies, in load order"""
+        return self._policies
+    
     def load_policies(self):
         """Load policies from YAML files"""
-        self.policies = []
+        policies = []
         
         # Load system policies first (highest priority, cannot be modified)
         system_policy_path = os.path.join(self.policies_dir, "system.policy.yaml")
         if os.path.exists(system_policy_path):
-            self._load_policy_file(system_policy_path, level="SYSTEM")
+            self._load_policy_file(system_policy_path, level="SYSTEM", policies=policies)
         
         # Load project policies (configurable)
         project_policy_path = os.path.join(self.policies_dir, "project.policy.yaml")
         if os.path.exists(project_policy_path):
-            self._load_policy_file(project_policy_path, level="PROJECT")
+            self._load_policy_file(project_policy_path, level="PROJECT", policies=policies)
+        
+        self._policies = tuple(policies)
+        # 按优先级排序：SYSTEM 级别的策略先执行
+        self._sorted_policies = sorted(
+            policies,
+            key=lambda p: 0 if p.level == "SYSTEM" else 1
+        )
     
-    def _load_policy_file(self, file_path: str, level: str):
-        """Load a single policy file"""
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+    def _load_policy_file(self, file_path: str, level: str, policies: List[GovernancePolicy]):
+        """Load a single policy file, appending its policies to policies"""
+        with open(file_path, "rb") as f:
+            data = yaml.load(f, Loader=_SafeLoader)
             if "policies" in data:
                 for policy_data in data["policies"]:
                     policy = GovernancePolicy(**policy_data)
                     policy.level = level
-                    self.policies.append(policy)
+                    policies.append(policy)
     
     def decide(self, violations: List[Dict[str, Any]]) -> List[Action]:
         """
@@ -99,25 +119,26 @@ class PolicyEngine:
         """
         actions = []
         
-        # 按优先级排序：SYSTEM 级别的策略先执行
-        sorted_policies = sorted(
-            self.policies, 
-            key=lambda p: 0 if p.level == "SYSTEM" else 1
-        )
+        sorted_policies = self._sorted_policies
+        
+        # Bind lookups used in the violation x policy loop once
+        match_policy = self._match_policy
+        add_action = actions.append
         
         for violation in violations:
+            violation_id = violation.get("id")
             for policy in sorted_policies:
-                if self._match_policy(policy, violation):
+                if match_policy(policy, violation):
                     for policy_action in policy.actions:
-                        # 创建结构化 Action 对象
-                        action = Action(
+                        # 创建结构化 Action 对象；各字段均来自已验证的策略，
+                        # 无需再次验证
+                        add_action(Action.model_construct(
                             type=policy_action.action,
                             reason=f"Policy {policy.id} matched violation",
-                            violation_id=violation.get("id"),
+                            violation_id=violation_id,
                             policy_id=policy.id,
                             params=policy_action.params
-                        )
-                        actions.append(action)
+                        ))
         
         return actions
     
@@ -2,7 +2,7 @@
 Score Engine - Governance scoring with irreversible decay
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any
 from enum import Enum
 
 from .events import GovernanceEvent, EventType
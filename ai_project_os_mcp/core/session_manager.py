@@ -25,6 +25,12 @@ class SessionManager:
         # 存储 Session 信息
         self.sessions = {}
         
+        # 活跃 Session ID 索引（dict 作有序集合，保持创建顺序）
+        self._active_session_ids = {}
+        
+        # Session 权限集合（创建时构建，O(1) 成员判断）
+        self._session_permissions = {}
+        
         # 存储操作日志
         self.operation_logs = {}
         
@@ -45,7 +51,9 @@ class SessionManager:
             str: Session ID
         """
         agent_id = agent_info["agent_id"]
-        session_id = f"{agent_id}:{int(time.time())}:{hash(json.dumps(agent_info)) % 10000:04d}"
+        # 同一操作内只读取一次时钟，各时间字段保持一致
+        now = int(time.time())
+        session_id = f"{agent_id}:{now}:{hash(json.dumps(agent_info)) % 10000:04d}"
         
         # 创建 Session
         self.sessions[session_id] = {
@@ -54,12 +62,16 @@ class SessionManager:
             "agent_role": agent_info["role"],
             "agent_name": agent_info["name"],
             "permissions": agent_info["permissions"],
-            "created_at": int(time.time()),
-            "expiry": int(time.time()) + (self.session_expiry_hours * 3600),
-            "last_activity": int(time.time()),
+            "created_at": now,
+            "expiry": now + (self.session_expiry_hours * 3600),
+            "last_activity": now,
             "status": "active"
         }
         
+        # 加入活跃索引
+        self._active_session_ids[session_id] = None
+        self._session_permissions[session_id] = frozenset(agent_info["permissions"])
+        
         # 初始化操作日志
         self.operation_logs[session_id] = []
         
@@ -75,11 +87,10 @@ class SessionManager:
         Returns:
             Optional[Dict]: Session 信息，若 Session 不存在或已过期则返回 None
         """
-        if session_id not in self.sessions:
+        session = self.sessions.get(session_id)
+        if session is None:
             return None
         
-        session = self.sessions[session_id]
-        
         # 检查 Session 是否过期
         if int(time.time()) > session["expiry"]:
             self.close_session(session_id)
@@ -97,10 +108,11 @@ class SessionManager:
         Returns:
             bool: 更新成功返回 True，否则返回 False
         """
-        if session_id not in self.sessions:
+        session = self.sessions.get(session_id)
+        if session is None:
             return False
         
-        self.sessions[session_id]["last_activity"] = int(time.time())
+        session["last_activity"] = int(time.time())
         return True
     
     def close_session(self, session_id: str) -> bool:
@@ -113,8 +125,10 @@ class SessionManager:
         Returns:
             bool: 关闭成功返回 True，否则返回 False
         """
-        if session_id in self.sessions:
-            self.sessions[session_id]["status"] = "closed"
+        session = self.sessions.get(session_id)
+        if session is not None:
+            session["status"] = "closed"
+            self._active_session_ids.pop(session_id, None)
             return True
         return False
     
@@ -131,31 +145,34 @@ class SessionManager:
         Returns:
             bool: 记录成功返回 True，否则返回 False
         """
-        if session_id not in self.sessions:
+        session = self.sessions.get(session_id)
+        if session is None:
             return False
         
+        # 同一操作内只读取一次时钟，活动时间与日志时间保持一致
+        now = time.time()
+        timestamp = int(now)
+        
         # 更新 Session 活动时间
-        self.update_session_activity(session_id)
+        session["last_activity"] = timestamp
         
         # 构建操作日志
         log_entry = {
-            "timestamp": int(time.time()),
-            "datetime": datetime.now().isoformat(),
+            "timestamp": timestamp,
+            "datetime": datetime.fromtimestamp(now).isoformat(),
             "operation": operation,
             "details": details,
             "success": success
         }
         
         # 记录日志
-        if session_id not in self.operation_logs:
-            self.operation_logs[session_id] = []
-        
-        self.operation_logs[session_id].append(log_entry)
+        logs = self.operation_logs.setdefault(session_id, [])
+        logs.append(log_entry)
         
         # 限制日志数量
-        if len(self.operation_logs[session_id]) > self.max_logs_per_session:
+        if len(logs) > self.max_logs_per_session:
             # 保留最新的日志
-            self.operation_logs[session_id] = self.operation_logs[session_id][-self.max_logs_per_session:]
+            self.operation_logs[session_id] = logs[-self.max_logs_per_session:]
         
         return True
     
@@ -170,11 +187,12 @@ class SessionManager:
         Returns:
             List[Dict]: 操作日志列表
         """
-        if session_id not in self.operation_logs:
+        logs = self.operation_logs.get(session_id)
+        if logs is None:
             return []
         
         # 返回最新的日志
-        return self.operation_logs[session_id][-limit:]
+        return logs[-limit:]
     
     def list_active_sessions(self) -> List[Dict]:
         """
@@ -186,8 +204,10 @@ class SessionManager:
         active_sessions = []
         current_time = int(time.time())
         
-        for session_id, session in self.sessions.items():
-            if session["status"] == "active" and current_time <= session["expiry"]:
+        # 只遍历活跃索引，已关闭的 Session 不再参与扫描
+        for session_id in self._active_session_ids:
+            session = self.sessions[session_id]
+            if current_time <= session["expiry"]:
                 active_sessions.append(session.copy())
         
         return active_sessions
@@ -210,10 +230,10 @@ class SessionManager:
         
         # 清理 Session 和日志
         for session_id in expired_sessions:
-            if session_id in self.sessions:
-                del self.sessions[session_id]
-            if session_id in self.operation_logs:
-                del self.operation_logs[session_id]
+            self.sessions.pop(session_id, None)
+            self._active_session_ids.pop(session_id, None)
+            self._session_permissions.pop(session_id, None)
+            self.operation_logs.pop(session_id, None)
         
         return len(expired_sessions)
     
@@ -228,11 +248,16 @@ class SessionManager:
         Returns:
             bool: 有权限返回 True，否则返回 False
         """
-        session = self.get_session(session_id)
-        if not session:
+        session = self.sessions.get(session_id)
+        if session is None:
+            return False
+
+        # 与 get_session 相同的过期处理，但无需复制 Session
+        if int(time.time()) > session["expiry"]:
+            self.close_session(session_id)
             return False
 
-        return action in session["permissions"]
+        return action in self._session_permissions[session_id]
 
 
 __all__ = []
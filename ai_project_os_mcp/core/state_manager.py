@@ -14,9 +14,31 @@ Key principles:
 
 import json
 import os
-from typing import Dict, Any, Optional
+import stat
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional
 from datetime import datetime
-import uuid
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson:
+    # Same JSON as the json module with default=str: datetimes and
+    # dataclasses are passed to default=str instead of orjson's own
+    # encoding (only the spelling of float exponents differs, e.g. 1e16
+    # vs 1e+16, which parse to the same value)
+    _ORJSON_PASSTHROUGH = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    _ORJSON_STATE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | _ORJSON_PASSTHROUGH
+    _ORJSON_HISTORY_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | _ORJSON_PASSTHROUGH
+
+
+class StateWriteError(OSError):
+    """
+    Raised when state batched by StateManager.batch_writes could not be
+    written to disk
+    """
 
 
 class StateManager:
@@ -38,9 +60,19 @@ class StateManager:
             state_file: Path to the state file
         """
         self.state_file = state_file
+        self._state_mtime_ns = None
+        self._batch_depth = 0
+        self._dirty = False
+        # A missing state file means a new project, which gets a new history log
+        is_new_state = not os.path.exists(state_file)
         self._state = self._load_state()
         self._state_history = []
-        self._save_state_history()
+        # History records not yet appended to the history log
+        self._pending_history = []
+        # History log, opened in append mode on first save and kept open
+        self._history_log = None
+        if is_new_state:
+            self._reset_state_history()
     
     def _load_state(self) -> Dict[str, Any]:
         """
@@ -51,13 +83,40 @@ class StateManager:
         """
         if os.path.exists(self.state_file):
             try:
-                with open(self.state_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                self._state_mtime_ns = self._get_state_mtime_ns()
+                with open(self.state_file, "rb") as f:
+                    raw = f.read()
+                return orjson.loads(raw) if orjson else json.loads(raw)
             except Exception:
                 # If state file is corrupted, return default state
                 return self._get_default_state()
         return self._get_default_state()
     
+    def _get_state_mtime_ns(self) -> Optional[int]:
+        """
+        Get the modification time of the state file
+        
+        Returns:
+            Optional[int]: mtime in nanoseconds, or None if not a regular file
+        """
+        try:
+            st = os.stat(self.state_file)
+        except OSError:
+            return None
+        return st.st_mtime_ns if stat.S_ISREG(st.st_mode) else None
+    
+    def _write_state_file(self):
+        """
+        Write current state to file and remember its modification time
+        """
+        if orjson:
+            raw = orjson.dumps(self._state, default=str, option=_ORJSON_STATE_OPTIONS)
+        else:
+            raw = json.dumps(self._state, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+        with open(self.state_file, "wb") as f:
+            f.write(raw)
+        self._state_mtime_ns = self._get_state_mtime_ns()
+    
     def _get_default_state(self) -> Dict[str, Any]:
         """
         Get default project state
@@ -65,22 +124,60 @@ class StateManager:
         Returns:
             Dict[str, Any]: Default state
         """
+        now = datetime.now().isoformat()
         return {
             "stage": "S1",
             "version": "1.0.3",
             "frozen": False,
-            "created_at": datetime.now().isoformat(),
-            "last_updated": datetime.now().isoformat()
+            "created_at": now,
+            "last_updated": now
         }
     
+    def _reset_state_history(self):
+        """
+        Start a new, empty state history log
+        
+        Only done for a new state file: managers opened on an existing state
+        file (the server, the engine, each adapter, ...) append to the log
+        they share instead of truncating each other's records.
+        """
+        try:
+            with open(f"{self.state_file}.history", "wb"):
+                pass
+        except Exception:
+            # Ignore errors when saving history for now
+            pass
+    
     def _save_state_history(self):
         """
-        Save state history to file
+        Append pending state history records to the history log
+        
+        The log is JSON lines, one record per state change, so each save
+        writes only the new records instead of rewriting the whole history.
+        A rollback is recorded as {"_op": "rollback"}, dropping the record
+        before it. The log is opened once in append mode (O_APPEND) and is
+        only truncated for a new state file, so several managers on the same
+        state file never overwrite each other's records; their records
+        interleave in write order.
         """
-        history_file = f"{self.state_file}.history"
+        if not self._pending_history:
+            return
         try:
-            with open(history_file, "w", encoding="utf-8") as f:
-                json.dump(self._state_history, f, indent=2, ensure_ascii=False, default=str)
+            if self._history_log is None:
+                self._history_log = open(f"{self.state_file}.history", "ab")
+            if orjson:
+                lines = [
+                    orjson.dumps(record, default=str, option=_ORJSON_HISTORY_OPTIONS)
+                    for record in self._pending_history
+                ]
+            else:
+                lines = [
+                    (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+                    for record in self._pending_history
+                ]
+            self._history_log.writelines(lines)
+            self._history_log.flush()
+            self._pending_history = []
         except Exception:
             # Ignore errors when saving history for now
             pass
@@ -89,9 +186,15 @@ class StateManager:
         """
         Get current state
         
+        The in-memory state is reused while the state file is unchanged;
+        if another writer has modified the file, it is re-read.
+        
         Returns:
             Dict[str, Any]: Current state
         """
+        mtime_ns = self._get_state_mtime_ns()
+        if not self._dirty and mtime_ns is not None and mtime_ns != self._state_mtime_ns:
+            self._state = self._load_state()
         return self._state.copy()
     
     def save_state(self, new_state: Dict[str, Any]) -> bool:
@@ -108,24 +211,42 @@ class StateManager:
             # Add update timestamp
             new_state["last_updated"] = datetime.now().isoformat()
             
-            # Save current state to history
-            self._state_history.append({
-                "timestamp": datetime.now().isoformat(),
+            # Keep a private copy so later changes by the caller do not leak in
+            return self._commit_state(new_state.copy())
+        except Exception:
+            return False
+    
+    def _commit_state(self, new_state: Dict[str, Any]) -> bool:
+        """
+        Make new_state the current state and persist it
+        
+        The dict is taken over as-is rather than copied, so it must be one
+        the caller built for this purpose and no longer modifies.
+        
+        Args:
+            new_state: New state, including its last_updated timestamp
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            # Save current state to history, stamped with the same clock
+            # reading as the new state's last_updated
+            record = {
+                "timestamp": new_state["last_updated"],
                 "state": self._state.copy()
-            })
+            }
+            self._state_history.append(record)
+            self._pending_history.append(record)
             
             # Keep only the last 100 states in history
             self._state_history = self._state_history[-100:]
             
             # Update current state
-            self._state = new_state.copy()
-            
-            # Save to file
-            with open(self.state_file, "w", encoding="utf-8") as f:
-                json.dump(self._state, f, indent=2, ensure_ascii=False)
+            self._state = new_state
             
-            # Save history
-            self._save_state_history()
+            # Save to file (deferred inside batch_writes)
+            self._persist()
             
             return True
         except Exception:
@@ -141,9 +262,11 @@ class StateManager:
         Returns:
             bool: True if successful, False otherwise
         """
+        # Build the final state once; it is already private, so no second copy
         new_state = self._state.copy()
         new_state.update(updates)
-        return self.save_state(new_state)
+        new_state["last_updated"] = datetime.now().isoformat()
+        return self._commit_state(new_state)
     
     def rollback_state(self) -> bool:
         """
@@ -160,21 +283,101 @@ class StateManager:
         
         # Remove the last history entry
         self._state_history.pop()
+        self._pending_history.append({"_op": "rollback"})
         
         # Save previous state as current
         self._state = previous_state.copy()
         
-        # Save to file
+        # Save to file (deferred inside batch_writes)
         try:
-            with open(self.state_file, "w", encoding="utf-8") as f:
-                json.dump(self._state, f, indent=2, ensure_ascii=False)
+            self._persist()
+            return True
+        except Exception:
+            return False
+    
+    def _persist(self):
+        """
+        Write state and history to disk, or mark them dirty inside a batch
+        """
+        if self._batch_depth:
+            self._dirty = True
+            return
+        
+        self._write_state_file()
+        self._save_state_history()
+        self._dirty = False
+    
+    @contextmanager
+    def batch_writes(self) -> Iterator["StateManager"]:
+        """
+        Coalesce state saves into a single write
+        
+        Inside the block, save_state / rollback_state update the in-memory
+        state immediately and report success; the state file and history are
+        written once when the outermost block exits.
+        
+        Yields:
+            StateManager: This state manager
             
-            # Save history
+        Raises:
+            StateWriteError: If the outermost block completed but writing the
+                batched state failed (the state is kept in memory)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            flushed = self._batch_depth or self.flush()
+        
+        # Only reached when the block itself did not raise
+        if not flushed:
+            raise StateWriteError(f"Failed to write batched state to {self.state_file}")
+    
+    def flush(self) -> bool:
+        """
+        Write pending batched state to disk
+        
+        On failure the state stays in memory, and the pending history
+        records are kept for the next successful write; the state is no
+        longer marked pending, so load_state can pick up changes made by
+        other writers again.
+        
+        Returns:
+            bool: True if successful or nothing was pending, False otherwise
+        """
+        if not self._dirty:
+            return True
+        try:
+            self._write_state_file()
             self._save_state_history()
-            
             return True
         except Exception:
             return False
+        finally:
+            self._dirty = False
+    
+    def close(self):
+        """
+        Write pending batched state and close the history log
+        """
+        self.flush()
+        self._close_history_log()
+    
+    def _close_history_log(self):
+        """
+        Close the history log if it is open
+        """
+        history_log = getattr(self, "_history_log", None)
+        if history_log is not None:
+            self._history_log = None
+            history_log.close()
+    
+    def __del__(self):
+        """
+        Release the history log when the manager is garbage collected
+        """
+        self._close_history_log()
     
     def get_state_history(self) -> list:
         """
@@ -249,7 +452,8 @@ class StateManager:
         new_state.pop("freeze_by", None)
         new_state.pop("freeze_at", None)
         new_state.pop("freeze_event_id", None)
-        return self.save_state(new_state)
+        new_state["last_updated"] = datetime.now().isoformat()
+        return self._commit_state(new_state)
 
 
 __all__ = []
\ No newline at end of file
@@ -2,14 +2,60 @@
 Trigger Engine - Evaluates events and detects violations
 """
 
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from pydantic import BaseModel, Field
-from enum import Enum
 
 from .events import EventType, GovernanceEvent
 from .violation import GovernanceViolation, ViolationLevel
 
 
+@lru_cache(maxsize=256)
+def _parse_condition(condition: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Split a condition string into (left, operator, right)
+    
+    Trigger conditions come from a small fixed set, so parsed results are
+    cached and each string is only split once.
+    
+    Args:
+        condition: Condition string (e.g., "stage != 'S5'")
+        
+    Returns:
+        (left, operator, right) with whitespace and quotes removed,
+        or None if no supported operator is found
+    """
+    # Remove whitespace
+    condition = condition.strip()
+    
+    # Split condition into parts
+    if "!=" in condition:
+        left, right = condition.split("!=")
+        operator = "!="
+    elif "==" in condition:
+        left, right = condition.split("==")
+        operator = "=="
+    elif ">" in condition:
+        left, right = condition.split(">")
+        operator = ">"
+    elif "<" in condition:
+        left, right = condition.split("<")
+        operator = "<"
+    elif ">=" in condition:
+        left, right = condition.split(">=")
+        operator = ">="
+    elif "<=" in condition:
+        left, right = condition.split("<=")
+        operator = "<="
+    else:
+        return None
+    
+    # Trim whitespace
+    left = left.strip()
+    right = right.strip().strip("'\"").strip()  # Remove quotes
+    return left, operator, right
+
+
 class TriggerCondition(BaseModel):
     """Trigger condition definition"""
     event: EventType = Field(..., description="Type of event to trigger on")
@@ -33,7 +79,16 @@ class TriggerEngine:
     """
     
     def __init__(self):
-        self.triggers = self._load_default_triggers()
+        # Registered triggers (read-only; changed only by add/remove_trigger)
+        self._triggers = tuple(self._load_default_triggers())
+        # Triggers grouped by event type, rebuilt whenever the triggers change
+        self._triggers_by_event = {}
+        self._index_triggers()
+    
+    @property
+    def triggers(self) -> Tuple[GovernanceTrigger, ...]:
+        """Registered triggers, in registration order"""
+        return self._triggers
     
     def _load_default_triggers(self) -> List[GovernanceTrigger]:
         """Load default governance triggers"""
@@ -83,7 +138,7 @@ class TriggerEngine:
         """
         violations = []
         
-        for trigger in self.triggers:
+        for trigger in self._triggers_by_event.get(event.event_type, ()):
             if not trigger.enabled:
                 continue
             
@@ -93,6 +148,15 @@ class TriggerEngine:
         
         return violations
     
+    def _index_triggers(self):
+        """
+        Group the registered triggers by event type, keeping registration order
+        """
+        index = {}
+        for trigger in self._triggers:
+            index.setdefault(trigger.when.event, []).append(trigger)
+        self._triggers_by_event = index
+    
     def _should_trigger(self, trigger: GovernanceTrigger, event: GovernanceEvent, state: Dict[str, Any]) -> bool:
         """
         Check if a trigger should fire for the given event and state
@@ -136,35 +200,12 @@ class TriggerEngine:
         Returns:
             True if condition is met, False otherwise
         """
-        # Remove whitespace
-        condition = condition.strip()
-        
-        # Split condition into parts
-        if "!=" in condition:
-            left, right = condition.split("!=")
-            operator = "!="
-        elif "==" in condition:
-            left, right = condition.split("==")
-            operator = "=="
-        elif ">" in condition:
-            left, right = condition.split(">")
-            operator = ">"
-        elif "<" in condition:
-            left, right = condition.split("<")
-            operator = "<"
-        elif ">=" in condition:
-            left, right = condition.split(">=")
-            operator = ">="
-        elif "<=" in condition:
-            left, right = condition.split("<=")
-            operator = "<="
-        else:
+        parsed = _parse_condition(condition)
+        if parsed is None:
             # Unknown condition format, return False to be safe
             return False
         
-        # Trim whitespace
-        left = left.strip()
-        right = right.strip().strip("'\"").strip()  # Remove quotes
+        left, operator, right = parsed
         
         # Get left value from context
         if left not in context:
@@ -202,7 +243,9 @@ class TriggerEngine:
     
     def _create_violation(self, trigger: GovernanceTrigger, event: GovernanceEvent) -> GovernanceViolation:
         """Create a violation object from a trigger and event"""
-        return GovernanceViolation(
+        # Every field comes from an already validated trigger or event, so
+        # skip revalidation; defaults (id, timestamp, status, ...) still apply
+        return GovernanceViolation.model_construct(
             level=trigger.violation,
             rule_id=trigger.id,
             event_id=event.id,
@@ -216,11 +259,13 @@ class TriggerEngine:
     
     def add_trigger(self, trigger: GovernanceTrigger):
         """Add a new trigger"""
-        self.triggers.append(trigger)
+        self._triggers += (trigger,)
+        self._index_triggers()
     
     def remove_trigger(self, trigger_id: str):
         """Remove a trigger by ID"""
-        self.triggers = [t for t in self.triggers if t.id != trigger_id]
+        self._triggers = tuple(t for t in self._triggers if t.id != trigger_id)
+        self._index_triggers()
 
 
 __all__ = []
\ No newline at end of file
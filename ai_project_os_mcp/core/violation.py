@@ -9,7 +9,7 @@ from enum import Enum
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from pydantic import BaseModel, Field
-import uuid
+from .ids import new_uuid4
 
 
 class ViolationLevel(str, Enum):
@@ -34,10 +34,13 @@ class GovernanceViolation(BaseModel):
     """
     Represents a governance violation that occurred
     
-    Violations are immutable once created, and can be resolved but not deleted
+    Violations are never deleted. They are mutable only in the sense that
+    resolving one updates status, resolved_by and resolved_at in place, so
+    every reference to the violation sees the resolution; all other fields
+    stay as created
     """
     id: str = Field(
-        default_factory=lambda: str(uuid.uuid4()),
+        default_factory=new_uuid4,
         description="Unique violation identifier"
     )
     
@@ -170,6 +173,8 @@ class InMemoryViolationStore(ViolationStore):
         Initialize the in-memory violation store
         """
         self.violations: Dict[str, GovernanceViolation] = {}
+        # Inverted index: event ID -> IDs of its violations (dict as ordered set)
+        self._violations_by_event: Dict[str, Dict[str, None]] = {}
     
     def save_violation(self, violation: GovernanceViolation) -> bool:
         """
@@ -181,7 +186,12 @@ class InMemoryViolationStore(ViolationStore):
         Returns:
             bool: Always True for in-memory storage
         """
+        previous = self.violations.get(violation.id)
+        if previous is not None and previous.event_id != violation.event_id:
+            self._violations_by_event[previous.event_id].pop(violation.id, None)
+        
         self.violations[violation.id] = violation
+        self._violations_by_event.setdefault(violation.event_id, {})[violation.id] = None
         return True
     
     def get_violation(self, violation_id: str) -> Optional[GovernanceViolation]:
@@ -212,7 +222,12 @@ class InMemoryViolationStore(ViolationStore):
         Returns:
             List[GovernanceViolation]: List of matching violations
         """
-        results = list(self.violations.values())
+        # Use the event index instead of scanning every violation
+        if "event_id" in filters:
+            violation_ids = self._violations_by_event.get(filters["event_id"], {})
+            results = [self.violations[violation_id] for violation_id in violation_ids]
+        else:
+            results = list(self.violations.values())
         
         # Apply filters
         if "level" in filters:
@@ -235,10 +250,6 @@ class InMemoryViolationStore(ViolationStore):
             end_time = filters["end_time"]
             results = [v for v in results if v.timestamp <= end_time]
         
-        if "event_id" in filters:
-            event_id = filters["event_id"]
-            results = [v for v in results if v.event_id == event_id]
-        
         # Sort by severity and then by timestamp (newest first)
         severity_order = {ViolationLevel.CRITICAL: 0, ViolationLevel.MAJOR: 1, ViolationLevel.MINOR: 2, ViolationLevel.INFO: 3}
         return sorted(
@@ -251,6 +262,9 @@ class InMemoryViolationStore(ViolationStore):
         """
         Mark a violation as resolved
         
+        The stored violation is updated in place, so objects previously
+        returned by get_violation / list_violations reflect the resolution.
+        
         Args:
             violation_id: The ID of the violation to resolve
             resolved_by: The ID of the actor resolving the violation
@@ -258,21 +272,15 @@ class InMemoryViolationStore(ViolationStore):
         Returns:
             bool: True if successful, False otherwise
         """
-        if violation_id not in self.violations:
+        violation = self.violations.get(violation_id)
+        if violation is None:
             return False
         
-        violation = self.violations[violation_id].copy()
-        
-        # Create a new violation instance with resolved state
-        resolved_violation = GovernanceViolation(
-            **violation.model_dump(),
-            status=ViolationStatus.RESOLVED,
-            resolved_by=resolved_by,
-            resolved_at=datetime.now(),
-            id=violation_id  # Keep the same ID
-        )
-        
-        self.violations[violation_id] = resolved_violation
+        # Resolve in place: only the resolution fields change, so there is
+        # no need to rebuild and revalidate the whole model
+        violation.status = ViolationStatus.RESOLVED
+        violation.resolved_by = resolved_by
+        violation.resolved_at = datetime.now()
         return True
 
 
@@ -87,7 +87,8 @@ class MCPServer:
         Returns:
             dict: Tool execution result
         """
-        if tool_name not in self.tools:
+        tool = self.tools.get(tool_name)
+        if tool is None:
             return {"error": f"Unknown tool: {tool_name}"}
         
         try:
@@ -95,7 +96,7 @@ class MCPServer:
             state = self.state_manager.load_state()
             
             # Call tool
-            result = self.tools[tool_name](state, payload or {})
+            result = tool(state, payload or {})
             
             # If freeze_stage tool, update state
             if tool_name == "freeze_stage" and result.get("success"):
@@ -84,12 +84,19 @@ def analyze_dependencies(state, payload):
                             dep_name = dep.split("==")[0].split(">=")[0].split("<=")[0].strip()
                             project_deps.add(dep_name)
     
+    # 按名称排序，保证输出顺序稳定（便于比较和缓存）
+    sorted_deps = sorted(project_deps)
+    
     # 检查依赖违规
     violations = []
     
+    # 名单转为集合，成员判断为 O(1)
+    blacklist_set = set(blacklist)
+    whitelist_set = set(whitelist)
+    
     # 检查黑名单
-    for dep in project_deps:
-        if dep in blacklist:
+    for dep in sorted_deps:
+        if dep in blacklist_set:
             violations.append({
                 "dependency": dep,
                 "type": "blacklist",
@@ -98,8 +105,8 @@ def analyze_dependencies(state, payload):
     
     # 检查白名单（如果白名单不为空）
     if whitelist:
-        for dep in project_deps:
-            if dep not in whitelist:
+        for dep in sorted_deps:
+            if dep not in whitelist_set:
                 violations.append({
                     "dependency": dep,
                     "type": "whitelist",
@@ -107,7 +114,7 @@ def analyze_dependencies(state, payload):
                 })
     
     return {
-        "dependencies": list(project_deps),
+        "dependencies": sorted_deps,
         "whitelist": whitelist,
         "blacklist": blacklist,
         "violations": violations
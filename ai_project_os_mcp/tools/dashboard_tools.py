@@ -81,15 +81,15 @@ def get_stats(state, payload):
     from ai_project_os_mcp.core.state_manager import StateManager
     state_manager = StateManager(config.project_root)
     current_state = state_manager.load_state()
+    state_manager.close()
     
-    # 统计审计记录数量
-    import re
+    # 统计审计记录数量（逐行读取，无需将整个审计日志载入内存）
     audit_count = 0
     audit_file = os.path.join(config.project_root, "docs", "S5_audit.md")
     if os.path.exists(audit_file):
         with open(audit_file, "r", encoding="utf-8") as f:
-            content = f.read()
-        audit_count = len(re.findall(r"## Sub-task:", content))
+            for line in f:
+                audit_count += line.count("## Sub-task:")
     
     # 分析依赖情况
     from ai_project_os_mcp.tools.context_tools import analyze_dependencies
@@ -11,6 +11,11 @@ import re
 import json
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class ExportAudit:
     """
     审计记录导出类
@@ -146,8 +151,13 @@ class ExportAudit:
         
         # 写入文件（如果提供了输出路径）
         if output_path:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(export_data, f, ensure_ascii=False, indent=2)
+            # 优先使用 orjson 序列化（输出与 json.dump(indent=2) 一致）
+            if orjson:
+                with open(output_path, "wb") as f:
+                    f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, "w", encoding="utf-8") as f:
+                    json.dump(export_data, f, ensure_ascii=False, indent=2)
         
         return export_data
     
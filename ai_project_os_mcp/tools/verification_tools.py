@@ -68,23 +68,20 @@ def verify_audit_integrity(state, payload):
             "reason": f"Audit file not found: {audit_file}"
         }
     
-    # 读取审计文件
+    # 逐行读取审计文件并提取所有 Commit Hash（匹配不跨行，无需载入整个文件）
+    commit_hashes = []
+    # 使用正则表达式匹配 Commit Hash
+    hash_pattern = re.compile(r"- Commit Hash: ([a-f0-9]{40})")
     try:
         with open(audit_file, "r", encoding="utf-8") as f:
-            content = f.read()
+            for line in f:
+                commit_hashes.extend(hash_pattern.findall(line))
     except Exception as e:
         return {
             "status": "FAILED",
             "reason": f"Error reading audit file: {str(e)}"
         }
     
-    # 提取所有 Commit Hash
-    commit_hashes = []
-    # 使用正则表达式匹配 Commit Hash
-    hash_pattern = r"- Commit Hash: ([a-f0-9]{40})"
-    matches = re.findall(hash_pattern, content)
-    commit_hashes.extend(matches)
-    
     if not commit_hashes:
         return {
             "status": "PASSED",
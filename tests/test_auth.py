@@ -0,0 +1,91 @@
+"""
+Auth Tests - Token 鉴权测试
+
+测试场景：
+1. 生成的 Token 可通过验证
+2. 撤销后的 Token 无法通过验证
+3. 改写编码的 Token 无法绕过撤销
+4. 修改返回的 Agent 信息不影响之后的验证结果
+5. 新注册的 Agent 可正常签发和验证 Token
+"""
+
+from ai_project_os_mcp.core.auth import AuthManager
+
+
+class TestAuth:
+    """Token 鉴权测试类"""
+    
+    def setup_method(self):
+        """设置测试环境"""
+        self.auth_manager = AuthManager()
+        self.token, _ = self.auth_manager.generate_token("coder")
+    
+    def test_generated_token_verifies(self):
+        """测试场景1：生成的 Token 可通过验证"""
+        agent_info, error = self.auth_manager.verify_token(self.token)
+        
+        assert error is None
+        assert agent_info["role"] == "coder"
+        assert "secret" not in agent_info
+    
+    def test_revoked_token_rejected(self):
+        """测试场景2：撤销后的 Token 无法通过验证"""
+        assert self.auth_manager.revoke_token(self.token)
+        
+        agent_info, error = self.auth_manager.verify_token(self.token)
+        assert agent_info is None
+        assert error is not None
+    
+    def test_revocation_not_bypassed_by_reencoding(self):
+        """测试场景3：改写编码的 Token 无法绕过撤销"""
+        assert self.auth_manager.revoke_token(self.token)
+        
+        encoded_payload, encoded_signature = self.token.split(".")
+        # 签名末位字符的低 2 位未被使用，翻转后解码结果不变
+        alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+        last = alphabet[alphabet.index(encoded_signature[-1]) ^ 1]
+        variants = [
+            f"{encoded_payload}.{encoded_signature[:-1]}{last}",
+            "*" + self.token,
+            f"{encoded_payload}=.{encoded_signature}",
+            f"{encoded_payload}.{encoded_signature}\n",
+            f"{encoded_payload.replace('-', '+').replace('_', '/')}"
+            f".{encoded_signature.replace('-', '+').replace('_', '/')}",
+        ]
+        for variant in variants:
+            if variant == self.token:
+                continue
+            agent_info, error = self.auth_manager.verify_token(variant)
+            assert agent_info is None, variant
+            assert error is not None
+    
+    def test_returned_agent_info_is_a_copy(self):
+        """测试场景4：修改返回的 Agent 信息不影响之后的验证结果"""
+        agents = self.auth_manager.list_agents()
+        agents["coder"]["role"] = "reviewer"
+        agents["coder"]["permissions"].append("verify_audit")
+        
+        agent_info, _ = self.auth_manager.verify_token(self.token)
+        agent_info["permissions"].append("read_state")
+        
+        agent_info, _ = self.auth_manager.verify_token(self.token)
+        assert agent_info["role"] == "coder"
+        assert agent_info["permissions"] == ["write_code", "run_tests", "submit_audit"]
+        assert self.auth_manager.list_agents()["coder"]["role"] == "coder"
+    
+    def test_agent_added_later_verifies(self):
+        """测试场景5：新注册的 Agent 可正常签发和验证 Token"""
+        self.auth_manager.verify_token(self.token)
+        self.auth_manager.agents["auditor"] = {
+            "name": "Auditor Agent",
+            "role": "auditor",
+            "permissions": ["read_code"],
+            "secret": None
+        }
+        
+        token, error = self.auth_manager.generate_token("auditor")
+        assert error is None
+        agent_info, error = self.auth_manager.verify_token(token)
+        assert error is None
+        assert agent_info["role"] == "auditor"
+        assert "auditor" in self.auth_manager.list_agents()
@@ -0,0 +1,97 @@
+"""
+Event Store Tests - 内存事件存储测试
+
+测试场景：
+1. 索引查询结果与逐条过滤 + 排序的结果一致（含 limit 与 count）
+2. 时间戳无法比较时 append 失败且不留下半写入的索引
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from ai_project_os_mcp.core.event_store import InMemoryEventStore
+from ai_project_os_mcp.core.events import GovernanceEvent, EventType, Actor
+
+
+def _actor(actor_id):
+    """创建测试 Actor"""
+    return Actor(id=actor_id, role="coder", role_type="AI", source="trae")
+
+
+def _reference_list(events, **filters):
+    """不使用索引的参考实现：逐条过滤后按时间倒序排序"""
+    results = list(events)
+    if "event_type" in filters:
+        results = [e for e in results if e.event_type == filters["event_type"]]
+    if "actor_id" in filters:
+        results = [e for e in results if e.actor.id == filters["actor_id"]]
+    if "start_time" in filters:
+        results = [e for e in results if e.timestamp >= filters["start_time"]]
+    if "end_time" in filters:
+        results = [e for e in results if e.timestamp <= filters["end_time"]]
+    results = sorted(results, key=lambda x: x.timestamp, reverse=True)
+    if filters.get("limit") is not None:
+        results = results[:filters["limit"]]
+    return results
+
+
+class TestInMemoryEventStore:
+    """内存事件存储测试类"""
+    
+    def test_indexed_queries_match_reference(self):
+        """测试场景1：索引查询结果与逐条过滤 + 排序的结果一致"""
+        rnd = random.Random(1)
+        base = datetime(2026, 1, 1)
+        event_types = [EventType.STATUS, EventType.TOOL_CALL, EventType.VIOLATION]
+        
+        for _ in range(50):
+            store = InMemoryEventStore()
+            appended = []
+            for _ in range(rnd.randint(0, 60)):
+                # 时间戳取值范围小，制造大量相同时间戳
+                event = GovernanceEvent(
+                    event_type=rnd.choice(event_types),
+                    actor=_actor(rnd.choice("xyz")),
+                    timestamp=base + timedelta(seconds=rnd.randint(0, 20))
+                )
+                assert store.append(event)
+                appended.append(event)
+            
+            for _ in range(20):
+                filters = {}
+                if rnd.random() < 0.5:
+                    filters["event_type"] = rnd.choice(event_types + [EventType.UNFREEZE])
+                if rnd.random() < 0.5:
+                    filters["actor_id"] = rnd.choice("xyzw")
+                if rnd.random() < 0.5:
+                    filters["start_time"] = base + timedelta(seconds=rnd.randint(-2, 22))
+                if rnd.random() < 0.5:
+                    filters["end_time"] = base + timedelta(seconds=rnd.randint(-2, 22))
+                limit = rnd.choice([None, None, 0, 1, 3, 100])
+                if limit is not None:
+                    filters["limit"] = limit
+                
+                expected = [e.id for e in _reference_list(appended, **filters)]
+                assert [e.id for e in store.list(**filters)] == expected, filters
+                assert store.count(**filters) == len(expected), filters
+    
+    def test_failed_append_leaves_store_unchanged(self):
+        """测试场景2：时间戳无法比较时 append 失败且不留下半写入的索引"""
+        store = InMemoryEventStore()
+        store.append(GovernanceEvent(event_type=EventType.STATUS, actor=_actor("x")))
+        
+        # 带时区的时间戳无法与默认的本地时间戳比较
+        aware_event = GovernanceEvent(
+            event_type=EventType.STATUS,
+            actor=_actor("x"),
+            timestamp=datetime.now(timezone.utc)
+        )
+        with pytest.raises(TypeError):
+            store.append(aware_event)
+        
+        assert store.get(aware_event.id) is None
+        assert store.count() == 1
+        assert len(store.list()) == 1
+        assert store.count(event_type=EventType.STATUS) == 1
+        assert store.count(actor_id="x") == 1
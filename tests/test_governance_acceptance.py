@@ -6,10 +6,22 @@ Governance Acceptance Tests - v2.5 核心功能验收测试
 2. 无 Actor → REJECT
 3. CRITICAL → global score 扣 30
 4. 冻结后 CODE_GENERATION → BLOCKED
+5. 批量写入：多次状态变更只写一次状态文件，历史记录逐条追加
+6. 批量写入未提交时，load_state 不会用磁盘上的旧文件覆盖内存状态
+7. 批量处理事件：handle_events 只写一次状态文件
+8. 状态含 datetime 时仍可保存，且是否安装 orjson 写出的内容一致
+9. 批量写入失败时报告错误，且之后仍能重新读取其他写入者的修改
+10. 同一状态文件上的多个 StateManager 不会清除彼此的历史记录
 """
 
+import json
+import os
+from datetime import datetime
+
 import pytest
 from ai_project_os_mcp.core import GovernanceEngine
+from ai_project_os_mcp.core import state_manager as state_manager_module
+from ai_project_os_mcp.core.state_manager import StateManager, StateWriteError
 from ai_project_os_mcp.core.events import GovernanceEvent, EventType, Actor
 from ai_project_os_mcp.core.violation import ViolationLevel
 
@@ -224,3 +236,156 @@ class TestGovernanceAcceptance:
         # 验证项目被解冻
         unfrozen_state = self.governance_engine.get_state()
         assert unfrozen_state["is_frozen"] == False, "项目应该被成功解冻"
+    
+    def _count_state_writes(self, state_manager, monkeypatch):
+        """统计状态文件写入次数"""
+        writes = []
+        write_state_file = state_manager._write_state_file
+        
+        def counting_write():
+            writes.append(1)
+            write_state_file()
+        
+        monkeypatch.setattr(state_manager, "_write_state_file", counting_write)
+        return writes
+    
+    def test_batch_writes_coalesce_state_saves(self, tmp_path, monkeypatch):
+        """测试场景5：批量写入只写一次状态文件，历史记录逐条追加"""
+        state_file = str(tmp_path / "state.json")
+        state_manager = StateManager(state_file)
+        writes = self._count_state_writes(state_manager, monkeypatch)
+        
+        stages = ["S2", "S3", "S4"]
+        with state_manager.batch_writes():
+            for stage in stages:
+                assert state_manager.set_stage(stage)
+            # 块内立即可见，但尚未写入磁盘
+            assert state_manager.get_stage() == "S4"
+            assert writes == []
+        
+        assert len(writes) == 1
+        with open(state_file, "r", encoding="utf-8") as f:
+            assert json.load(f)["stage"] == "S4"
+        with open(f"{state_file}.history", "r", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        assert [record["state"]["stage"] for record in records] == ["S1", "S2", "S3"]
+        
+        # 没有待写入内容时 flush 不写文件
+        assert state_manager.flush()
+        assert len(writes) == 1
+    
+    def test_load_state_keeps_pending_batch(self, tmp_path):
+        """测试场景6：批量写入未提交时，load_state 不会重新读取磁盘上的旧文件"""
+        state_file = str(tmp_path / "state.json")
+        state_manager = StateManager(state_file)
+        state_manager.set_stage("S2")
+        
+        with state_manager.batch_writes():
+            state_manager.set_stage("S3")
+            
+            # 其他写入者修改了状态文件（确保修改时间变化）
+            with open(state_file, "w", encoding="utf-8") as f:
+                json.dump({"stage": "S5"}, f)
+            st = os.stat(state_file)
+            os.utime(state_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            
+            assert state_manager.load_state()["stage"] == "S3"
+        
+        with open(state_file, "r", encoding="utf-8") as f:
+            assert json.load(f)["stage"] == "S3"
+    
+    def test_handle_events_single_state_write(self, tmp_path, monkeypatch):
+        """测试场景7：handle_events 批量处理事件只写一次状态文件"""
+        state_file = str(tmp_path / "state.json")
+        self.governance_engine.state_manager = StateManager(state_file)
+        writes = self._count_state_writes(self.governance_engine.state_manager, monkeypatch)
+        
+        actor = Actor(
+            id="test_actor",
+            role="system",
+            role_type="SYSTEM",
+            source="api",
+            name="Test System"
+        )
+        events = [
+            GovernanceEvent(event_type=EventType.STATUS, actor=actor, payload={})
+            for _ in range(3)
+        ]
+        
+        results = self.governance_engine.handle_events(events)
+        
+        assert [result["event_id"] for result in results] == [event.id for event in events]
+        assert len(writes) == 1
+        # 每次状态变更仍各自追加一条历史记录
+        history = self.governance_engine.state_manager.get_state_history()
+        assert len(history) >= len(events)
+        with open(f"{state_file}.history", "r", encoding="utf-8") as f:
+            assert sum(1 for _ in f) == len(history)
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_state_with_datetime_persists(self, tmp_path, monkeypatch, use_orjson):
+        """测试场景8：状态含 datetime 时仍可保存，且与是否安装 orjson 无关"""
+        if use_orjson and state_manager_module.orjson is None:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(state_manager_module, "orjson", None)
+        
+        state_file = str(tmp_path / "state.json")
+        state_manager = StateManager(state_file)
+        detected_at = datetime(2026, 1, 1, 12, 0, 0, 5)
+        
+        assert state_manager.update_state({"violations": [{"detected_at": detected_at}]})
+        assert state_manager.set_stage("S2")
+        
+        with open(state_file, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        assert saved["stage"] == "S2"
+        assert saved["violations"] == [{"detected_at": str(detected_at)}]
+        with open(f"{state_file}.history", "r", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        assert records[-1]["state"]["violations"] == [{"detected_at": str(detected_at)}]
+    
+    def test_failed_batch_write_reported(self, tmp_path, monkeypatch):
+        """测试场景9：批量写入失败时报告错误，且之后仍能重新读取其他写入者的修改"""
+        state_file = str(tmp_path / "state.json")
+        state_manager = StateManager(state_file)
+        state_manager.set_stage("S2")
+        
+        def failing_write():
+            raise OSError("disk full")
+        
+        monkeypatch.setattr(state_manager, "_write_state_file", failing_write)
+        with pytest.raises(StateWriteError):
+            with state_manager.batch_writes():
+                assert state_manager.set_stage("S3")
+        
+        # 其他写入者修改了状态文件，失败的批量写入不应阻止重新读取
+        with open(state_file, "w", encoding="utf-8") as f:
+            json.dump({"stage": "S5"}, f)
+        st = os.stat(state_file)
+        os.utime(state_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert state_manager.load_state()["stage"] == "S5"
+        
+        # handle_event 在结果中报告未能保存的状态
+        self.governance_engine.state_manager = state_manager
+        actor = Actor(id="test_actor", role="system", role_type="SYSTEM", source="api")
+        result = self.governance_engine.handle_event(
+            GovernanceEvent(event_type=EventType.STATUS, actor=actor, payload={})
+        )
+        assert "state_error" in result
+    
+    def test_state_managers_share_history_log(self, tmp_path):
+        """测试场景10：同一状态文件上的多个 StateManager 不会清除彼此的历史记录"""
+        state_file = str(tmp_path / "state.json")
+        first = StateManager(state_file)
+        first.set_stage("S2")
+        
+        second = StateManager(state_file)
+        second.set_stage("S3")
+        first.set_stage("S4")
+        
+        with open(f"{state_file}.history", "rb") as f:
+            raw = f.read()
+        assert b"\x00" not in raw
+        records = [json.loads(line) for line in raw.splitlines()]
+        assert [record["state"]["stage"] for record in records] == ["S1", "S2", "S2"]